@@ -53,6 +53,7 @@ struct DaemonConfig {
         bool http_server_enabled{false};
         int http_server_port{8080};
         std::string http_server_bind_address{"127.0.0.1"};
+        std::string http_server_unix_socket{};
     } monitoring;
 };
 
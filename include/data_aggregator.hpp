@@ -3,6 +3,7 @@
 #include <vector>
 #include <string>
 #include <chrono>
+#include <map>
 #include <optional>
 #include "sensor_data.hpp"
 #include "json_response_builder.hpp"
@@ -42,6 +43,8 @@ public:
     static std::optional<std::chrono::minutes> parse_interval(const std::string& interval_str);
 
 private:
+    friend class StreamingAggregator;
+    
     /**
      * Aggregate a group of readings into statistical summary
      * @param readings Vector of readings for a single time interval
@@ -105,6 +108,65 @@ private:
         std::chrono::minutes interval_minutes);
 };
 
+/**
+ * Incremental aggregator for readings that arrive in batches
+ *
+ * Produces the same result as DataAggregator::aggregate_by_interval, but keeps
+ * only running statistics per interval, so memory grows with the number of
+ * intervals rather than the number of readings.
+ */
+class StreamingAggregator {
+public:
+    /**
+     * Constructor
+     * @param interval_minutes Interval duration in minutes
+     */
+    explicit StreamingAggregator(std::chrono::minutes interval_minutes);
+    
+    /**
+     * Add one reading
+     * @param reading Sensor reading (readings should arrive sorted by timestamp)
+     */
+    void add(const SensorData& reading);
+    
+    /**
+     * Add a batch of readings
+     * @param readings Sensor readings (should be sorted by timestamp)
+     */
+    void add(const std::vector<SensorData>& readings);
+    
+    /**
+     * Build the aggregates for all readings added so far
+     * @return Vector of aggregated data for each interval, including empty ones
+     */
+    std::vector<AggregateData> finish() const;
+
+private:
+    /**
+     * Running count, sum, min and max for one sensor value
+     */
+    struct RunningStats {
+        double sum = 0.0;
+        double min = 0.0;
+        double max = 0.0;
+        uint64_t count = 0;
+        
+        void add(const std::optional<float>& value);
+        AggregateData::ValueStats to_value_stats() const;
+    };
+    
+    struct IntervalStats {
+        RunningStats co2_ppm;
+        RunningStats temperature_c;
+        RunningStats humidity_percent;
+    };
+    
+    std::chrono::minutes interval_minutes_;
+    std::map<std::chrono::system_clock::time_point, IntervalStats> intervals_;
+    std::optional<std::chrono::system_clock::time_point> first_timestamp_;
+    std::optional<std::chrono::system_clock::time_point> last_timestamp_;
+};
+
 /**
  * Interval parsing utilities
  */
@@ -307,9 +307,12 @@ public:
      * Start the health monitor server
      * @param port Port to listen on
      * @param bind_address Address to bind to (default: localhost)
+     * @param unix_socket_path Optional UNIX domain socket path to listen on as well
+     *        (empty to disable); local clients can skip TCP setup entirely
      * @return true if server started successfully
      */
-    bool start(int port = 8080, const std::string& bind_address = "127.0.0.1");
+    bool start(int port = 8080, const std::string& bind_address = "127.0.0.1",
+               const std::string& unix_socket_path = "");
     
     /**
      * Stop the health monitor server
@@ -336,6 +339,7 @@ private:
     bool running_;
     int port_;
     std::string bind_address_;
+    std::string unix_socket_path_;
     std::thread server_thread_;
     
     /**
@@ -343,6 +347,18 @@ private:
      */
     void server_loop();
     
+    /**
+     * Create the non-blocking UNIX domain listening socket
+     * @return Socket file descriptor, or -1 on failure
+     */
+    int create_unix_listener() const;
+    
+    /**
+     * Read one request from an accepted client, respond and close it
+     * @param client_fd Connected client socket
+     */
+    void handle_client_connection(int client_fd);
+    
     /**
      * Handle health check request
      * @return JSON response with health status
@@ -82,7 +82,32 @@ public:
      */
     static std::pair<std::string, std::string> extract_method_and_path(const std::string& request);
     
+    /**
+     * Check whether the request's Accept header lists a media type
+     * @param request Full HTTP request string
+     * @param media_type Media type to look for (e.g., "application/json")
+     * @return true if the Accept header contains the media type
+     */
+    static bool accepts_media_type(const std::string& request, const std::string& media_type);
+    
+    /**
+     * Check whether the request's Accept-Encoding header lists a content coding
+     * @param request Full HTTP request string
+     * @param encoding Content coding to look for (e.g., "gzip"), matched
+     *        case-insensitively against whole comma-separated tokens
+     * @return true if the coding is listed without a weight of q=0
+     */
+    static bool accepts_encoding(const std::string& request, const std::string& encoding);
+    
 private:
+    /**
+     * Find a request header value
+     * @param request Full HTTP request string
+     * @param name Lower-case header name
+     * @return Header value (without the name and colon), or nullopt if absent
+     */
+    static std::optional<std::string> find_header_value(const std::string& request, const std::string& name);
+    
     /**
      * Convert hex character to integer
      * @param hex Hex character ('0'-'9', 'A'-'F', 'a'-'f')
@@ -60,6 +60,17 @@ public:
                                            const std::string& start_time,
                                            const std::string& end_time);
     
+    /**
+     * Create column-oriented JSON response for readings endpoints
+     * 
+     * Each field is sent as one array and timestamps as integer microseconds
+     * since the Unix epoch, so clients can decode whole columns at once
+     * instead of one object per reading.
+     * @param readings Vector of sensor readings
+     * @return Complete HTTP response with COLUMNS_CONTENT_TYPE body
+     */
+    static std::string create_columns_response(const std::vector<SensorData>& readings);
+    
     /**
      * Create JSON response for aggregates endpoint
      * @param aggregates Vector of aggregate data
@@ -122,9 +133,14 @@ public:
      * Create HTTP response header
      * @param status_code HTTP status code
      * @param content_length Length of content body
+     * @param content_type Media type of the body
      * @return HTTP response header string
      */
-    static std::string create_http_header(int status_code, size_t content_length = 0);
+    static std::string create_http_header(int status_code, size_t content_length = 0,
+                                        const std::string& content_type = "application/json");
+    
+    /// Media type of the column-oriented readings response
+    static constexpr const char* COLUMNS_CONTENT_TYPE = "application/vnd.sensor-daemon.columns+json";
 
 private:
     
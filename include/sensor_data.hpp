@@ -84,6 +84,14 @@ public:
      * @return Internal sensor data struct, or nullopt if deserialization fails
      */
     static std::optional<SensorData> deserialize(const std::string& data);
+    
+    /**
+     * Deserialize a binary buffer to internal SensorData without copying it
+     * @param data Pointer to serialized binary data (e.g. a RocksDB value slice)
+     * @param size Size of the serialized data in bytes
+     * @return Internal sensor data struct, or nullopt if deserialization fails
+     */
+    static std::optional<SensorData> deserialize(const char* data, size_t size);
 };
 
 } // namespace sensor_daemon
\ No newline at end of file
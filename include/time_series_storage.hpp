@@ -37,10 +37,12 @@ public:
      * Initialize the storage engine with the specified data directory
      * @param data_directory Path to directory where database files will be stored
      * @param retention_hours Data retention period in hours (default: 24*365 = 1 year)
+     * @param block_cache_mb Size of the RocksDB block cache in MB (default: 2MB)
      * @return true if initialization successful, false otherwise
      */
     bool initialize(const std::string& data_directory, 
-                   std::chrono::hours retention_hours = std::chrono::hours(24 * 365));
+                   std::chrono::hours retention_hours = std::chrono::hours(24 * 365),
+                   size_t block_cache_mb = 2);
     
     /**
      * Store a sensor reading in the time-series database
@@ -106,6 +108,8 @@ public:
      * @param callback Function to call for each batch of readings
      * @param batch_size Number of readings per batch (default: 1000)
      * @param max_results Maximum total results (default: 50000)
+     * @param fill_cache Whether blocks read are added to the block cache
+     *        (default: false, so bulk exports do not evict hot blocks)
      * @return Number of readings processed
      */
     size_t stream_readings_in_range(
@@ -113,7 +117,8 @@ public:
         std::chrono::system_clock::time_point end,
         std::function<bool(const std::vector<SensorData>&)> callback,
         size_t batch_size = 1000,
-        size_t max_results = 50000) const;
+        size_t max_results = 50000,
+        bool fill_cache = false) const;
     
     /**
      * Database information structure
@@ -161,6 +166,7 @@ private:
     std::unique_ptr<rocksdb::DBWithTTL> db_;
     std::string data_directory_;
     std::chrono::hours retention_hours_;
+    size_t block_cache_mb_ = 2;
     
     // Performance optimization components
     mutable std::unique_ptr<RecentReadingsCache> recent_cache_;
@@ -170,6 +176,10 @@ private:
     mutable std::chrono::steady_clock::time_point last_cache_cleanup_;
     static constexpr std::chrono::minutes CACHE_CLEANUP_INTERVAL{5};
     
+    // Approximate stored size of one reading (key, protobuf value and block
+    // overhead), used to turn RocksDB's range size estimate into a row count
+    static constexpr uint64_t ESTIMATED_BYTES_PER_RECORD = 32;
+    
     /**
      * Get optimized RocksDB options for time-series data
      * @return Configured RocksDB options
@@ -232,12 +242,27 @@ private:
      */
     void maintain_cache() const;
     
+    /**
+     * Estimate how many readings lie in a key range without scanning it
+     * @param start_key Inclusive start key
+     * @param end_key Exclusive end key
+     * @return Estimated record count from GetApproximateSizes (0 if unknown)
+     */
+    uint64_t estimate_records_in_range(const std::string& start_key, const std::string& end_key) const;
+    
     /**
      * Create optimized RocksDB iterator with prefetching
      * @param prefetch_size Number of keys to prefetch (0 for default)
+     * @param lower_bound Optional inclusive lower key bound (must outlive the iterator)
+     * @param upper_bound Optional exclusive upper key bound (must outlive the iterator)
+     * @param fill_cache Whether blocks read by the iterator are added to the block cache
      * @return Unique pointer to iterator
      */
-    std::unique_ptr<rocksdb::Iterator> create_optimized_iterator(size_t prefetch_size = 0) const;
+    std::unique_ptr<rocksdb::Iterator> create_optimized_iterator(
+        size_t prefetch_size = 0,
+        const rocksdb::Slice* lower_bound = nullptr,
+        const rocksdb::Slice* upper_bound = nullptr,
+        bool fill_cache = true) const;
 };
 
 } // namespace sensor_daemon
\ No newline at end of file
@@ -24,45 +24,52 @@ def main():
         with SensorDataReader(api_url) as reader:
             print("=== Sensor Daemon Python Interface Demo ===\n")
             
+            # The queries are independent, so fetch them all in one batch
+            end_time = datetime.now()
+            status_result, info, recent_data, hourly_data, aggregates = reader.batch([
+                {'op': 'status'},
+                {'op': 'info'},
+                {'op': 'recent', 'count': 10},
+                {'op': 'range', 'start': end_time - timedelta(hours=1), 'end': end_time},
+                {'op': 'aggregates', 'start': end_time - timedelta(hours=24),
+                 'end': end_time, 'interval': '1H'},
+            ])
+            
             # Check daemon status
             print("1. Checking daemon status...")
-            is_running = reader.is_daemon_running()
+            is_running = status_result is True
             status = "RUNNING" if is_running else "NOT RUNNING"
             print(f"   Daemon status: {status}\n")
             
             # Get database info
             print("2. Database information...")
-            try:
-                info = reader.get_database_info()
+            if isinstance(info, Exception):
+                print(f"   Error getting database info: {info}\n")
+            else:
                 print(f"   Total records: {info.get('total_records', 'Unknown')}")
                 print(f"   Implementation: {info.get('implementation', 'HTTP API')}")
                 if info.get('earliest_timestamp'):
                     print(f"   Earliest reading: {info['earliest_timestamp']}")
                     print(f"   Latest reading: {info['latest_timestamp']}")
                 print()
-            except Exception as e:
-                print(f"   Error getting database info: {e}\n")
             
             # Get recent readings
             print("3. Getting recent readings...")
-            try:
-                recent_data = reader.get_recent_readings(10)
+            if isinstance(recent_data, Exception):
+                print(f"   Error getting recent readings: {recent_data}\n")
+            else:
                 if not recent_data.empty:
                     print(f"   Retrieved {len(recent_data)} recent readings:")
                     print(recent_data.to_string(index=False))
                 else:
                     print("   No recent readings found")
                 print()
-            except Exception as e:
-                print(f"   Error getting recent readings: {e}\n")
             
             # Get readings from last hour
             print("4. Getting readings from last hour...")
-            try:
-                end_time = datetime.now()
-                start_time = end_time - timedelta(hours=1)
-                hourly_data = reader.get_readings_range(start_time, end_time)
-                
+            if isinstance(hourly_data, Exception):
+                print(f"   Error getting hourly readings: {hourly_data}\n")
+            else:
                 if not hourly_data.empty:
                     print(f"   Retrieved {len(hourly_data)} readings from last hour:")
                     print(hourly_data.head().to_string(index=False))
@@ -71,16 +78,12 @@ def main():
                 else:
                     print("   No readings found in the last hour")
                 print()
-            except Exception as e:
-                print(f"   Error getting hourly readings: {e}\n")
             
             # Get aggregated data
             print("5. Getting hourly aggregates for last 24 hours...")
-            try:
-                end_time = datetime.now()
-                start_time = end_time - timedelta(hours=24)
-                aggregates = reader.get_aggregates(start_time, end_time, interval='1H')
-                
+            if isinstance(aggregates, Exception):
+                print(f"   Error getting aggregates: {aggregates}\n")
+            else:
                 if not aggregates.empty:
                     print(f"   Retrieved {len(aggregates)} hourly aggregates:")
                     # Show only relevant columns
@@ -93,8 +96,6 @@ def main():
                 else:
                     print("   No aggregate data available")
                 print()
-            except Exception as e:
-                print(f"   Error getting aggregates: {e}\n")
             
             print("=== Demo completed successfully ===")
             
@@ -112,17 +113,20 @@ def main():
 
 def demonstrate_with_mock_data():
     """Demonstrate the interface structure with mock data."""
+    import numpy as np
     import pandas as pd
+    from sensor_daemon.reader import READING_DTYPES
     
     print("=== Mock Data Demo ===\n")
     
-    # Create sample data structure
+    # Create sample data structure from arrays already in the reader's dtypes,
+    # so pandas assembles the columns without inferring or converting them
     sample_data = pd.DataFrame({
-        'timestamp': pd.date_range('2024-01-01 12:00:00', periods=5, freq='30T'),
-        'co2_ppm': [410.5, 415.2, 408.7, 412.1, 409.8],
-        'temperature_c': [22.1, 22.3, 22.0, 22.2, 22.1],
-        'humidity_percent': [45.2, 46.1, 44.8, 45.5, 45.0],
-        'quality_flags': [7, 7, 7, 7, 7]  # All sensors valid
+        'timestamp': pd.date_range('2024-01-01 12:00:00', periods=5, freq='30min', tz='UTC'),
+        'co2_ppm': np.array([410.5, 415.2, 408.7, 412.1, 409.8], dtype=READING_DTYPES['co2_ppm']),
+        'temperature_c': np.array([22.1, 22.3, 22.0, 22.2, 22.1], dtype=READING_DTYPES['temperature_c']),
+        'humidity_percent': np.array([45.2, 46.1, 44.8, 45.5, 45.0], dtype=READING_DTYPES['humidity_percent']),
+        'quality_flags': np.full(5, 7, dtype=READING_DTYPES['quality_flags'])  # All sensors valid
     })
     
     print("Sample sensor data structure:")
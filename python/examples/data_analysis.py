@@ -6,45 +6,44 @@ Advanced data analysis examples using sensor_daemon Python interface.
 import sys
 import os
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from sensor_daemon import SensorDataReader
+from sensor_daemon import CachedSensorDataReader
 
 
-def analyze_daily_patterns(reader, days=7):
-    """Analyze daily patterns in sensor data."""
+def analyze_daily_patterns(hourly_data, days=7):
+    """Analyze daily patterns in hourly aggregated sensor data."""
     print(f"=== Daily Pattern Analysis (Last {days} days) ===")
     
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=days)
-    
     try:
-        # Get hourly aggregates
-        hourly_data = reader.get_aggregates(start_time, end_time, interval='1H')
-        
         if hourly_data.empty:
             print("No data available for analysis")
             return
         
-        # Add hour of day column
-        hourly_data['hour'] = pd.to_datetime(hourly_data['timestamp']).dt.hour
+        # Add hour of day column (0-23 fits in a single byte group key)
+        hourly_data['hour'] = hourly_data['timestamp'].dt.hour.astype(np.int8)
         
         # Group by hour to find daily patterns
         if 'co2_ppm_mean' in hourly_data.columns:
-            hourly_patterns = hourly_data.groupby('hour')['co2_ppm_mean'].agg(['mean', 'std', 'min', 'max'])
+            hourly_patterns = hourly_data.groupby('hour', sort=True)['co2_ppm_mean'].agg(
+                mean='mean', std='std', min='min', max='max'
+            )
             
             print("CO2 Patterns by Hour of Day:")
             print(hourly_patterns.round(2))
             
             # Find peak and low hours
-            peak_hour = hourly_patterns['mean'].idxmax()
-            low_hour = hourly_patterns['mean'].idxmin()
+            means = hourly_patterns['mean'].to_numpy()
+            hours = hourly_patterns.index.to_numpy()
+            i_peak = np.nanargmax(means)
+            i_low = np.nanargmin(means)
             
-            print(f"\nPeak CO2 hour: {peak_hour}:00 ({hourly_patterns.loc[peak_hour, 'mean']:.1f} ppm)")
-            print(f"Lowest CO2 hour: {low_hour}:00 ({hourly_patterns.loc[low_hour, 'mean']:.1f} ppm)")
+            print(f"\nPeak CO2 hour: {hours[i_peak]}:00 ({means[i_peak]:.1f} ppm)")
+            print(f"Lowest CO2 hour: {hours[i_low]}:00 ({means[i_low]:.1f} ppm)")
         
         print()
         
@@ -52,17 +51,11 @@ def analyze_daily_patterns(reader, days=7):
         print(f"Error in daily pattern analysis: {e}")
 
 
-def analyze_correlations(reader, days=7):
-    """Analyze correlations between sensor measurements."""
+def analyze_correlations(data, days=7):
+    """Analyze correlations between raw sensor measurements."""
     print(f"=== Correlation Analysis (Last {days} days) ===")
     
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=days)
-    
     try:
-        # Get raw data for correlation analysis
-        data = reader.get_readings_range(start_time, end_time)
-        
         if data.empty:
             print("No data available for correlation analysis")
             return
@@ -81,15 +74,15 @@ def analyze_correlations(reader, days=7):
         print("Sensor Measurement Correlations:")
         print(correlations.round(3))
         
-        # Highlight strong correlations
+        # Highlight strong correlations (upper triangle, excluding diagonal)
         print("\nStrong correlations (|r| > 0.5):")
-        for i in range(len(correlations.columns)):
-            for j in range(i+1, len(correlations.columns)):
-                corr_val = correlations.iloc[i, j]
-                if abs(corr_val) > 0.5:
-                    col1 = correlations.columns[i]
-                    col2 = correlations.columns[j]
-                    print(f"  {col1} vs {col2}: {corr_val:.3f}")
+        arr = correlations.to_numpy()
+        rows, cols = np.triu_indices_from(arr, k=1)
+        vals = arr[rows, cols]
+        mask = np.abs(vals) > 0.5
+        names = np.asarray(correlations.columns)
+        for col1, col2, corr_val in zip(names[rows[mask]], names[cols[mask]], vals[mask]):
+            print(f"  {col1} vs {col2}: {corr_val:.3f}")
         
         print()
         
@@ -97,52 +90,51 @@ def analyze_correlations(reader, days=7):
         print(f"Error in correlation analysis: {e}")
 
 
-def analyze_data_quality(reader, days=1):
-    """Analyze data quality and missing values."""
+def analyze_data_quality(data, days=1):
+    """Analyze data quality and missing values in raw sensor readings."""
     print(f"=== Data Quality Analysis (Last {days} day(s)) ===")
     
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=days)
-    
     try:
-        data = reader.get_readings_range(start_time, end_time)
-        
         if data.empty:
             print("No data available for quality analysis")
             return
         
-        print(f"Total readings: {len(data)}")
+        n = len(data)
+        print(f"Total readings: {n}")
         
-        # Check for missing values
+        # Check for missing values (one pass over all sensor columns)
         print("\nMissing value analysis:")
-        for col in ['co2_ppm', 'temperature_c', 'humidity_percent']:
-            if col in data.columns:
-                missing_count = data[col].isna().sum()
-                missing_pct = (missing_count / len(data)) * 100
-                print(f"  {col}: {missing_count} missing ({missing_pct:.1f}%)")
+        cols = [col for col in ['co2_ppm', 'temperature_c', 'humidity_percent'] if col in data.columns]
+        missing_counts = data[cols].isna().to_numpy().sum(axis=0)
+        for col, missing_count, missing_pct in zip(cols, missing_counts, missing_counts / n * 100):
+            print(f"  {col}: {missing_count} missing ({missing_pct:.1f}%)")
         
         # Analyze quality flags if available
         if 'quality_flags' in data.columns:
             print("\nQuality flag analysis:")
-            flag_counts = data['quality_flags'].value_counts().sort_index()
-            for flag, count in flag_counts.items():
-                pct = (count / len(data)) * 100
-                print(f"  Flag {flag}: {count} readings ({pct:.1f}%)")
+            # Flags are a small bitfield (one bit per sensor), so count by value directly
+            flag_counts = np.bincount(data['quality_flags'].to_numpy(dtype=np.int64), minlength=8)
+            # Format all lines first and emit them with one write
+            print("\n".join(
+                f"  Flag {flag}: {flag_counts[flag]} readings ({flag_counts[flag] / n * 100:.1f}%)"
+                for flag in np.flatnonzero(flag_counts)
+            ))
         
         # Check for data gaps
-        if len(data) > 1:
-            data_sorted = data.sort_values('timestamp')
-            time_diffs = data_sorted['timestamp'].diff().dt.total_seconds()
+        if n > 1:
+            # Range readings arrive sorted by timestamp; work on int64 nanoseconds
+            ts_ns = data['timestamp'].to_numpy(dtype='datetime64[ns]').view('i8')
+            diffs_ns = np.diff(ts_ns)
             
             # Assuming normal sampling interval (get median)
-            normal_interval = time_diffs.median()
-            large_gaps = time_diffs[time_diffs > normal_interval * 2]
+            normal_ns = np.median(diffs_ns)
+            large_gaps_ns = diffs_ns[diffs_ns > normal_ns * 2]
             
             print(f"\nTiming analysis:")
-            print(f"  Normal sampling interval: {normal_interval:.0f} seconds")
-            print(f"  Large gaps detected: {len(large_gaps)}")
-            if len(large_gaps) > 0:
-                print(f"  Largest gap: {large_gaps.max():.0f} seconds")
+            print(f"  Normal sampling interval: {normal_ns / 1e9:.0f} seconds")
+            print(f"  Large gaps detected: {len(large_gaps_ns)}")
+            if len(large_gaps_ns) > 0:
+                print(f"  Largest gap: {large_gaps_ns.max() / 1e9:.0f} seconds")
         
         print()
         
@@ -150,17 +142,13 @@ def analyze_data_quality(reader, days=1):
         print(f"Error in data quality analysis: {e}")
 
 
-def generate_summary_report(reader, days=7):
-    """Generate a comprehensive summary report."""
+def generate_summary_report(daily_data, end_time, days=7):
+    """Generate a comprehensive summary report from daily aggregates."""
     print(f"=== Summary Report (Last {days} days) ===")
     
-    end_time = datetime.now()
     start_time = end_time - timedelta(days=days)
     
     try:
-        # Get daily aggregates for summary
-        daily_data = reader.get_aggregates(start_time, end_time, interval='1D')
-        
         if daily_data.empty:
             print("No data available for summary report")
             return
@@ -175,14 +163,16 @@ def generate_summary_report(reader, days=7):
             ('humidity_percent_mean', 'Humidity', '%')
         ]
         
+        # Compute all statistics in one call (NaN values are skipped)
+        cols = [col for col, _, _ in sensors if col in daily_data.columns]
+        stats = daily_data[cols].agg(['mean', 'min', 'max', 'std', 'count'])
+        
         for col, name, unit in sensors:
-            if col in daily_data.columns:
-                values = daily_data[col].dropna()
-                if not values.empty:
-                    print(f"\n{name} Summary:")
-                    print(f"  Average: {values.mean():.1f} {unit}")
-                    print(f"  Range: {values.min():.1f} - {values.max():.1f} {unit}")
-                    print(f"  Std Dev: {values.std():.1f} {unit}")
+            if col in cols and stats.at['count', col] > 0:
+                print(f"\n{name} Summary:")
+                print(f"  Average: {stats.at['mean', col]:.1f} {unit}")
+                print(f"  Range: {stats.at['min', col]:.1f} - {stats.at['max', col]:.1f} {unit}")
+                print(f"  Std Dev: {stats.at['std', col]:.1f} {unit}")
         
         print()
         
@@ -192,33 +182,53 @@ def generate_summary_report(reader, days=7):
 
 def main():
     """Run comprehensive data analysis."""
-    db_path = "/var/lib/sensor-daemon/data"
-    
-    # Check if database exists
-    if not os.path.exists(db_path):
-        print(f"Database not found at {db_path}")
-        print("This example requires actual sensor data to analyze.")
-        return 1
+    api_url = "http://localhost:8080"
+    days = 7
     
     try:
-        with SensorDataReader(db_path) as reader:
+        # Several analyses query the same windows, so reuse cached results
+        with CachedSensorDataReader(api_url) as reader:
             print("=== Sensor Data Analysis Suite ===\n")
             
+            # Fetch the shared data concurrently; each frame feeds several analyses
+            end_time = datetime.now()
+            start_time = end_time - timedelta(days=days)
+            quality_start = end_time - timedelta(days=1)
+            results = reader.batch([
+                {'op': 'status'},
+                {'op': 'range', 'start': start_time, 'end': end_time},
+                {'op': 'range', 'start': quality_start, 'end': end_time},
+                {'op': 'aggregates', 'start': start_time, 'end': end_time, 'interval': '1H'},
+                {'op': 'aggregates', 'start': start_time, 'end': end_time, 'interval': '1D'},
+            ])
+            
+            names = ['daemon status', 'raw readings', 'last day of readings',
+                     'hourly aggregates', 'daily aggregates']
+            for i, (name, result) in enumerate(zip(names, results)):
+                if isinstance(result, Exception):
+                    print(f"Error fetching {name}: {result}")
+                    results[i] = False if i == 0 else pd.DataFrame()
+            is_running, raw_data, quality_data, hourly_data, daily_data = results
+            
             # Check if daemon is running
-            if reader.is_daemon_running():
+            if is_running:
                 print("✓ Sensor daemon is running")
             else:
                 print("⚠ Sensor daemon is not running (analyzing existing data)")
             print()
             
             # Run various analyses
-            generate_summary_report(reader, days=7)
-            analyze_daily_patterns(reader, days=7)
-            analyze_correlations(reader, days=7)
-            analyze_data_quality(reader, days=1)
+            generate_summary_report(daily_data, end_time, days=days)
+            analyze_daily_patterns(hourly_data, days=days)
+            analyze_correlations(raw_data, days=days)
+            analyze_data_quality(quality_data, days=1)
             
             print("=== Analysis completed ===")
             
+    except ConnectionError:
+        print(f"Error: Cannot connect to sensor-daemon API at {api_url}")
+        print("This example requires a running sensor-daemon with HTTP API enabled.")
+        return 1
     except Exception as e:
         print(f"Error: {e}")
         return 1
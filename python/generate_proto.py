@@ -7,6 +7,12 @@ import os
 import subprocess
 import sys
 
+try:
+    from grpc_tools import protoc
+    GRPC_TOOLS_AVAILABLE = True
+except ImportError:
+    GRPC_TOOLS_AVAILABLE = False
+
 def generate_protobuf():
     """Generate Python protobuf bindings."""
     proto_dir = "../proto"
@@ -17,13 +23,23 @@ def generate_protobuf():
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate Python bindings
-    cmd = [
-        "protoc",
+    args = [
         f"--proto_path={proto_dir}",
         f"--python_out={output_dir}",
         os.path.join(proto_dir, proto_file)
     ]
     
+    # Prefer the bundled compiler from grpcio-tools, which runs in-process
+    if GRPC_TOOLS_AVAILABLE:
+        rc = protoc.main(["protoc"] + args)
+        if rc != 0:
+            print(f"Error generating protobuf bindings: protoc exited with code {rc}")
+            return False
+        print(f"Successfully generated Python protobuf bindings in {output_dir}/")
+        return True
+    
+    cmd = ["protoc"] + args
+    
     try:
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print(f"Successfully generated Python protobuf bindings in {output_dir}/")
@@ -34,7 +50,7 @@ def generate_protobuf():
         print(f"stderr: {e.stderr}")
         return False
     except FileNotFoundError:
-        print("Error: protoc not found. Please install Protocol Buffers compiler.")
+        print("Error: protoc not found. Please install Protocol Buffers compiler or grpcio-tools.")
         return False
 
 if __name__ == "__main__":
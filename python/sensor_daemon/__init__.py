@@ -7,6 +7,7 @@ or RocksDB dependencies are required.
 """
 
 from .reader import SensorDataReader
+from .cache import CachedSensorDataReader
 
 __version__ = "1.0.0"
-__all__ = ["SensorDataReader"]
\ No newline at end of file
+__all__ = ["SensorDataReader", "CachedSensorDataReader"]
\ No newline at end of file
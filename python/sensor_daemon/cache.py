@@ -0,0 +1,162 @@
+"""
+Caching SensorDataReader for repeated and sliding-window queries.
+
+This module provides a SensorDataReader variant that memoizes range and
+aggregate queries, so that analyses asking for the same window skip the
+HTTP round trip and response parsing.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+import pandas as pd
+
+from .reader import RANGE_RESULT_LIMIT, SensorDataReader
+
+# Number of distinct query windows kept per query type
+CACHE_SIZE = 64
+
+
+def _floor_minute(timestamp: datetime) -> datetime:
+    """Round a datetime down to the start of its minute."""
+    return timestamp.replace(second=0, microsecond=0)
+
+
+def _ceil_minute(timestamp: datetime) -> datetime:
+    """Round a datetime up to the next whole minute."""
+    floored = _floor_minute(timestamp)
+    if floored == timestamp:
+        return floored
+    return floored + timedelta(minutes=1)
+
+
+def _as_utc(timestamp: datetime) -> pd.Timestamp:
+    """Convert a datetime to a UTC Timestamp, taking naive values as UTC."""
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize('UTC')
+    return timestamp.tz_convert('UTC')
+
+
+def _trim(readings: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+    """Return the readings with start <= timestamp <= end as a new frame."""
+    timestamps = readings['timestamp']
+    mask = (timestamps >= _as_utc(start)) & (timestamps <= _as_utc(end))
+    # Boolean indexing returns a new frame, so no copy is needed
+    return readings[mask].reset_index(drop=True)
+
+
+def _is_live(window_end: datetime) -> bool:
+    """Check whether a window reaches the current minute, which is still filling."""
+    return _as_utc(window_end) >= pd.Timestamp.now(tz='UTC').floor('min')
+
+
+class CachedSensorDataReader(SensorDataReader):
+    """
+    SensorDataReader that caches range and aggregate query results.
+    
+    Query windows are widened to whole minutes (start rounded down, end
+    rounded up) and used as the cache key, so calls made within the same
+    minute share one daemon request; range results are trimmed back to the
+    requested times. Windows that reach the current minute are not cached,
+    since readings are still being added to them.
+    
+    A range that lies inside the most recently fetched range is sliced from
+    it instead of being requested again, unless that response may have been
+    cut off by the daemon's result limit. Returned DataFrames are never the
+    cached ones, so callers are free to modify them.
+    """
+    
+    def __init__(self, api_url: str = "http://localhost:8080", timeout: int = 30,
+                 cache_size: int = CACHE_SIZE):
+        """
+        Initialize the CachedSensorDataReader.
+        
+        Args:
+            api_url: Base URL of the sensor-daemon HTTP API
+            timeout: Request timeout in seconds
+            cache_size: Maximum number of cached windows per query type
+        
+        Raises:
+            ConnectionError: If the API is not accessible
+            RuntimeError: If the API is not responding correctly
+        """
+        super().__init__(api_url, timeout)
+        self._cached_range = lru_cache(maxsize=cache_size)(super().get_readings_range)
+        self._cached_aggregates = lru_cache(maxsize=cache_size)(super().get_aggregates)
+        
+        # (start, end, readings) of the last range fetched from the daemon
+        self._last_range = None
+    
+    def get_readings_range(self, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+        Get sensor readings within a time range, using the cache.
+        
+        Args:
+            start: Start datetime (inclusive)
+            end: End datetime (inclusive)
+        
+        Returns:
+            pandas DataFrame with readings in the specified time range
+        
+        Raises:
+            ValueError: If start is after end
+            RuntimeError: If API request fails
+        """
+        if start >= end:
+            raise ValueError("Start time must be before end time")
+        
+        window_start = _floor_minute(start)
+        window_end = _ceil_minute(end)
+        if _is_live(window_end):
+            return super().get_readings_range(start, end)
+        
+        last = self._last_range
+        if last is not None:
+            last_start, last_end, readings = last
+            if (_as_utc(last_start) <= _as_utc(window_start)
+                    and _as_utc(window_end) <= _as_utc(last_end)
+                    and (last_start, last_end) != (window_start, window_end)):
+                return _trim(readings, start, end)
+        
+        readings = self._cached_range(window_start, window_end)
+        # A capped response is missing readings past the cap, so slices of
+        # it would be too
+        if len(readings) < RANGE_RESULT_LIMIT:
+            self._last_range = (window_start, window_end, readings)
+        else:
+            self._last_range = None
+        return _trim(readings, start, end)
+    
+    def get_aggregates(self, start: datetime, end: datetime,
+                      interval: str = "1H") -> pd.DataFrame:
+        """
+        Compute statistical aggregates over time intervals, using the cache.
+        
+        Args:
+            start: Start datetime (inclusive, rounded down to the minute)
+            end: End datetime (inclusive, rounded up to the minute)
+            interval: Pandas time interval string (e.g., '1H', '30T', '1D')
+        
+        Returns:
+            pandas DataFrame with aggregated statistics for each time interval
+        
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API request fails
+        """
+        if start >= end:
+            raise ValueError("Start time must be before end time")
+        
+        window_end = _ceil_minute(end)
+        if _is_live(window_end):
+            return super().get_aggregates(start, end, interval)
+        
+        return self._cached_aggregates(
+            _floor_minute(start), window_end, interval
+        ).copy()
+    
+    def invalidate(self):
+        """Discard all cached query results."""
+        self._cached_range.cache_clear()
+        self._cached_aggregates.cache_clear()
+        self._last_range = None
@@ -3,60 +3,175 @@
 Utility script to check RocksDB Python binding availability and capabilities.
 """
 
+import glob
+import importlib.util
+import json
+import os
+import subprocess
 import sys
+from functools import lru_cache
 
+# Probe results are cached here, keyed on the interpreter and library files
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "sensor_daemon", "rocksdb_check.json")
 
-def check_python_rocksdb():
-    """Check if python-rocksdb is available."""
+# Common RocksDB shared library locations
+LIBRARY_PATHS = [
+    '/usr/lib/librocksdb.so',
+    '/usr/local/lib/librocksdb.so',
+    '/usr/lib/x86_64-linux-gnu/librocksdb.so',
+    '/opt/homebrew/lib/librocksdb.dylib',  # macOS ARM
+    '/usr/local/lib/librocksdb.dylib',     # macOS Intel
+]
+
+# Child-process probes: exit code 2 means the import failed, any other
+# non-zero exit means the binding imported but is not working
+BINDING_PROBES = {
+    'rocksdb': (
+        "import sys\n"
+        "try:\n"
+        "    import rocksdb\n"
+        "except ImportError as e:\n"
+        "    print(e); sys.exit(2)\n"
+        "rocksdb.Options()\n"
+        "print(getattr(rocksdb, '__version__', 'unknown'))\n"
+    ),
+    'rocksdb_python': (
+        "import sys\n"
+        "try:\n"
+        "    from rocksdb_python import Options, PyDB, ReadOptions, WriteOptions\n"
+        "except ImportError as e:\n"
+        "    print(e); sys.exit(2)\n"
+        "Options()\n"
+        "print('unknown')\n"
+    ),
+}
+
+
+def _mtime(path):
+    """Return the modification time of a file, or None if it is missing."""
     try:
-        import rocksdb
-        print("✓ python-rocksdb is available")
-        
-        # Test basic functionality
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _fingerprint():
+    """Describe the installed libraries and bindings the probes depend on."""
+    libraries = {}
+    for path in LIBRARY_PATHS:
+        for match in sorted(glob.glob(path + '*')):
+            libraries[match] = _mtime(match)
+    
+    bindings = {}
+    for module in BINDING_PROBES:
+        # find_spec locates the module without importing its shared library
         try:
-            opts = rocksdb.Options()
-            print("  - Options creation: OK")
-            
-            # Test if we can create a database instance (without actually opening)
-            print("  - Full iterator support: Available")
-            print("  - Recommended for sensor-daemon")
-            return True
-        except Exception as e:
-            print(f"  - Error testing functionality: {e}")
-            return False
-            
-    except ImportError as e:
-        print(f"✗ python-rocksdb not available: {e}")
+            spec = importlib.util.find_spec(module)
+        except (ImportError, ValueError):
+            spec = None
+        origin = spec.origin if spec else None
+        bindings[module] = [origin, _mtime(origin) if origin else None]
+    
+    return {'python': sys.executable, 'libraries': libraries, 'bindings': bindings}
+
+
+def _probe_binding(module):
+    """Import a binding in a short-lived interpreter and report the result."""
+    try:
+        result = subprocess.run(
+            [sys.executable, '-c', BINDING_PROBES[module]],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        return {'available': False, 'working': False, 'detail': str(e)}
+    
+    output = (result.stdout.strip() or result.stderr.strip()).splitlines()
+    detail = output[-1] if output else f"exit code {result.returncode}"
+    return {
+        'available': result.returncode != 2,
+        'working': result.returncode == 0,
+        'detail': detail,
+    }
+
+
+@lru_cache(maxsize=None)
+def probe_bindings():
+    """
+    Check which RocksDB Python bindings can be imported.
+    
+    The bindings are imported in child processes so the checker never keeps
+    librocksdb loaded itself. Results are cached in CACHE_FILE and reused
+    until the interpreter, the binding modules or the RocksDB library files
+    change.
+    
+    Returns:
+        Dictionary mapping module name to a result dictionary with
+        'available', 'working' and 'detail' keys
+    """
+    fingerprint = _fingerprint()
+    
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('fingerprint') == fingerprint:
+            return cached['results']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    results = {module: _probe_binding(module) for module in BINDING_PROBES}
+    
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'results': results}, f)
+    except OSError:
+        pass  # Caching is best effort
+    
+    return results
+
+
+def check_python_rocksdb():
+    """Check if python-rocksdb is available."""
+    result = probe_bindings()['rocksdb']
+    if not result['available']:
+        print(f"✗ python-rocksdb not available: {result['detail']}")
         return False
+    
+    print("✓ python-rocksdb is available")
+    if not result['working']:
+        print(f"  - Error testing functionality: {result['detail']}")
+        return False
+    
+    print(f"  - Version: {result['detail']}")
+    print("  - Options creation: OK")
+    print("  - Full iterator support: Available")
+    print("  - Recommended for sensor-daemon")
+    return True
 
 
 def check_rocksdb_python():
     """Check if rocksdb-python is available."""
-    try:
-        from rocksdb_python import Options, PyDB, ReadOptions, WriteOptions
-        print("✓ rocksdb-python is available")
-        
-        # Test basic functionality
-        try:
-            opts = Options()
-            print("  - Options creation: OK")
-            print("  - Limited functionality (no iterators)")
-            print("  - Only single-key lookups supported")
-            print("  - NOT recommended for sensor-daemon")
-            return True
-        except Exception as e:
-            print(f"  - Error testing functionality: {e}")
-            return False
-            
-    except ImportError as e:
-        print(f"✗ rocksdb-python not available: {e}")
+    result = probe_bindings()['rocksdb_python']
+    if not result['available']:
+        print(f"✗ rocksdb-python not available: {result['detail']}")
         return False
+    
+    print("✓ rocksdb-python is available")
+    if not result['working']:
+        print(f"  - Error testing functionality: {result['detail']}")
+        return False
+    
+    print("  - Options creation: OK")
+    print("  - Limited functionality (no iterators)")
+    print("  - Only single-key lookups supported")
+    print("  - NOT recommended for sensor-daemon")
+    return True
 
 
 def check_system_rocksdb():
     """Check if system RocksDB library is available."""
-    import subprocess
-    
     print("\nSystem RocksDB library check:")
     
     # Check for pkg-config
@@ -84,17 +199,8 @@ def check_system_rocksdb():
         print("? pkg-config not available, cannot check RocksDB library")
     
     # Check common library locations
-    import os
-    common_paths = [
-        '/usr/lib/librocksdb.so',
-        '/usr/local/lib/librocksdb.so',
-        '/usr/lib/x86_64-linux-gnu/librocksdb.so',
-        '/opt/homebrew/lib/librocksdb.dylib',  # macOS ARM
-        '/usr/local/lib/librocksdb.dylib',     # macOS Intel
-    ]
-    
     found_libs = []
-    for path in common_paths:
+    for path in LIBRARY_PATHS:
         if os.path.exists(path):
             found_libs.append(path)
     
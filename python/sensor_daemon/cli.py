@@ -6,6 +6,67 @@ import argparse
 import sys
 from datetime import datetime, timedelta
 from sensor_daemon import SensorDataReader
+from sensor_daemon.reader import unix_socket_url
+
+# Bound once; every time-range command parses its arguments with it
+_iso = datetime.fromisoformat
+
+
+def _cmd_recent(reader, args):
+    """Print the most recent readings."""
+    data = reader.get_recent_readings(args.count)
+    print(f"Retrieved {len(data)} recent readings:")
+    print(data.to_string(index=False))
+
+
+def _cmd_range(reader, args):
+    """Print the readings in a time range, one chunk at a time."""
+    start = _iso(args.start)
+    end = _iso(args.end)
+    print(f"Readings from {start} to {end}:")
+    
+    # Print each chunk as it arrives instead of formatting the whole range;
+    # tab-separated rows stay aligned across chunks, unlike to_string(),
+    # which sizes columns per chunk
+    total = 0
+    for chunk in reader.iter_readings_range(start, end):
+        chunk.to_csv(sys.stdout, sep="\t", index=False, header=(total == 0))
+        total += len(chunk)
+    print(f"Retrieved {total} readings")
+
+
+def _cmd_aggregate(reader, args):
+    """Print aggregated statistics for a time range."""
+    start = _iso(args.start)
+    end = _iso(args.end)
+    data = reader.get_aggregates(start, end, args.interval)
+    print(f"Aggregated data from {start} to {end} (interval: {args.interval}):")
+    print(data.to_string(index=False))
+
+
+def _cmd_status(reader, args):
+    """Print whether the daemon is running."""
+    is_running = reader.is_daemon_running()
+    status = "RUNNING" if is_running else "NOT RUNNING"
+    print(f"Sensor daemon status: {status}")
+
+
+def _cmd_info(reader, args):
+    """Print database information."""
+    info = reader.get_database_info()
+    print("Database Information:")
+    for key, value in info.items():
+        print(f"  {key}: {value}")
+
+
+# Command name -> handler(reader, args)
+HANDLERS = {
+    "recent": _cmd_recent,
+    "range": _cmd_range,
+    "aggregate": _cmd_aggregate,
+    "status": _cmd_status,
+    "info": _cmd_info,
+}
 
 
 def main():
@@ -20,6 +81,12 @@ def main():
         help="Base URL of the sensor-daemon HTTP API"
     )
     
+    parser.add_argument(
+        "--unix-socket",
+        help="Connect through the daemon's UNIX socket instead of --api-url "
+             "(requires requests-unixsocket)"
+    )
+    
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
     # Recent readings command
@@ -75,36 +142,9 @@ def main():
         return 1
     
     try:
-        with SensorDataReader(args.api_url) as reader:
-            if args.command == "recent":
-                data = reader.get_recent_readings(args.count)
-                print(f"Retrieved {len(data)} recent readings:")
-                print(data.to_string(index=False))
-                
-            elif args.command == "range":
-                start = datetime.fromisoformat(args.start)
-                end = datetime.fromisoformat(args.end)
-                data = reader.get_readings_range(start, end)
-                print(f"Retrieved {len(data)} readings from {start} to {end}:")
-                print(data.to_string(index=False))
-                
-            elif args.command == "aggregate":
-                start = datetime.fromisoformat(args.start)
-                end = datetime.fromisoformat(args.end)
-                data = reader.get_aggregates(start, end, args.interval)
-                print(f"Aggregated data from {start} to {end} (interval: {args.interval}):")
-                print(data.to_string(index=False))
-                
-            elif args.command == "status":
-                is_running = reader.is_daemon_running()
-                status = "RUNNING" if is_running else "NOT RUNNING"
-                print(f"Sensor daemon status: {status}")
-                
-            elif args.command == "info":
-                info = reader.get_database_info()
-                print("Database Information:")
-                for key, value in info.items():
-                    print(f"  {key}: {value}")
+        api_url = unix_socket_url(args.unix_socket) if args.unix_socket else args.api_url
+        with SensorDataReader(api_url) as reader:
+            HANDLERS[args.command](reader, args)
                 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -6,10 +6,139 @@ used by the sensor-daemon for storing time-series sensor data.
 """
 
 import subprocess
-from datetime import datetime
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List
+from urllib.parse import quote
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import requests_unixsocket
+    UNIXSOCKET_AVAILABLE = True
+except ImportError:
+    UNIXSOCKET_AVAILABLE = False
+
+# URL scheme for talking to the daemon over its UNIX domain socket
+UNIX_SOCKET_SCHEME = 'http+unix://'
+
+# Maximum number of concurrent batch requests, and the connection pool size
+# that gives each of them its own connection
+POOL_MAXSIZE = 4
+
+# Default time span fetched per request by iter_readings_range
+RANGE_WINDOW = timedelta(hours=1)
+
+# Most readings the daemon returns for one /data/range request; a response
+# of this size may have been cut off
+RANGE_RESULT_LIMIT = 10000
+
+# Column layout and dtypes of readings DataFrames
+READING_COLUMNS = ['timestamp', 'co2_ppm', 'temperature_c', 'humidity_percent', 'quality_flags']
+READING_DTYPES = {
+    'co2_ppm': 'float64',
+    'temperature_c': 'float64',
+    'humidity_percent': 'float64',
+    'quality_flags': 'int64',
+}
+
+# Media type of the daemon's column-oriented readings response; the plain
+# JSON row layout is still accepted from daemons that do not offer it
+COLUMNS_MEDIA_TYPE = 'application/vnd.sensor-daemon.columns+json'
+READINGS_ACCEPT = f'{COLUMNS_MEDIA_TYPE}, application/json;q=0.9'
+
+# The daemon always sends ISO 8601 timestamps; naming the format lets pandas
+# skip per-value format inference (supported since pandas 2.0)
+TIMESTAMP_FORMAT = 'ISO8601' if int(pd.__version__.split('.')[0]) >= 2 else None
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def unix_socket_url(socket_path: str) -> str:
+    """
+    Build an API URL for the daemon's UNIX domain socket.
+    
+    Args:
+        socket_path: Filesystem path of the socket (http_server_unix_socket)
+        
+    Returns:
+        URL usable as SensorDataReader's api_url
+    """
+    return UNIX_SOCKET_SCHEME + quote(socket_path, safe='')
+
+
+def _parse_timestamps(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the ISO 8601 'timestamp' column to UTC datetimes in one pass."""
+    df['timestamp'] = pd.to_datetime(
+        df['timestamp'], utc=True, format=TIMESTAMP_FORMAT, cache=True
+    )
+    return df
+
+
+def _readings_to_dataframe(readings: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a readings DataFrame with a fixed column layout and dtypes.
+    
+    Each column is filled straight into a typed NumPy array, so pandas
+    neither infers dtypes from the row dicts nor copies through an
+    intermediate object block. Missing sensor values become NaN and a
+    missing quality_flags becomes 0.
+    """
+    n = len(readings)
+    columns = {'timestamp': [reading['timestamp'] for reading in readings]}
+    for column, dtype in READING_DTYPES.items():
+        default = 0 if column == 'quality_flags' else np.nan
+        columns[column] = np.fromiter(
+            (reading.get(column, default) for reading in readings), dtype=dtype, count=n
+        )
+    
+    return _parse_timestamps(pd.DataFrame(columns, columns=READING_COLUMNS, copy=False))
+
+
+def _columns_to_dataframe(columns: Dict[str, List[Any]]) -> pd.DataFrame:
+    """
+    Build a readings DataFrame from the daemon's column-oriented response.
+    
+    Each column arrives as one JSON array, so it converts to a typed NumPy
+    array in a single call, and timestamps are integer microseconds since
+    the Unix epoch rather than ISO 8601 strings. Missing sensor values
+    (null) become NaN.
+    """
+    data = {
+        'timestamp': pd.to_datetime(
+            np.asarray(columns['timestamp_us'], dtype=np.int64), unit='us', utc=True
+        )
+    }
+    for column, dtype in READING_DTYPES.items():
+        data[column] = np.asarray(columns[column], dtype=dtype)
+    
+    return pd.DataFrame(data, columns=READING_COLUMNS, copy=False)
+
+
+def _response_to_dataframe(response: requests.Response) -> pd.DataFrame:
+    """Decode a readings response in whichever layout the daemon sent."""
+    data = _parse_json(response)
+    if 'error' in data:
+        raise RuntimeError(f"API error: {data['error']}")
+    
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+    if content_type == COLUMNS_MEDIA_TYPE:
+        return _columns_to_dataframe(data['columns'])
+    
+    return _readings_to_dataframe(data.get('readings', []))
 
 
 class SensorDataReader:
@@ -25,17 +154,30 @@ class SensorDataReader:
         Initialize the SensorDataReader.
         
         Args:
-            api_url: Base URL of the sensor-daemon HTTP API
+            api_url: Base URL of the sensor-daemon HTTP API; use
+                unix_socket_url() to connect over the daemon's UNIX socket
             timeout: Request timeout in seconds
             
         Raises:
             ConnectionError: If the API is not accessible
-            RuntimeError: If the API is not responding correctly
+            RuntimeError: If the API is not responding correctly, or a UNIX
+                socket URL is given without requests-unixsocket installed
         """
         self.api_url = api_url.rstrip('/')
         self.timeout = timeout
+        
+        if self.api_url.startswith(UNIX_SOCKET_SCHEME) and not UNIXSOCKET_AVAILABLE:
+            raise RuntimeError("requests-unixsocket is required for UNIX socket API URLs")
+        
         self.session = requests.Session()
         
+        # Size the pool for concurrent batch requests
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if UNIXSOCKET_AVAILABLE:
+            self.session.mount(UNIX_SOCKET_SCHEME, requests_unixsocket.UnixAdapter())
+        
         # Test connection
         try:
             response = self.session.get(f"{self.api_url}/health", timeout=5)
@@ -58,7 +200,57 @@ class SensorDataReader:
             self.session.close()
             self.session = None
     
-
+    def batch(self, operations: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Execute several independent read operations in one call.
+        
+        Each operation is a dictionary with an 'op' key naming the query
+        ('status', 'info', 'recent', 'range' or 'aggregates') and the
+        keyword arguments of the corresponding method, for example
+        {'op': 'recent', 'count': 10}. The operations are issued
+        concurrently from a thread pool. The daemon serves one request at a
+        time and closes each connection, so this only overlaps client-side
+        connection setup and response parsing with the other requests.
+        
+        Args:
+            operations: List of operation dictionaries
+            
+        Returns:
+            List of results in the same order as the operations. A failed
+            operation yields its exception instead of a result, so one bad
+            query does not discard the others.
+            
+        Raises:
+            ValueError: If an operation is missing or unknown
+        """
+        handlers = {
+            'status': self.is_daemon_running,
+            'info': self.get_database_info,
+            'recent': self.get_recent_readings,
+            'range': self.get_readings_range,
+            'aggregates': self.get_aggregates,
+        }
+        
+        calls = []
+        for operation in operations:
+            kwargs = dict(operation)
+            op = kwargs.pop('op', None)
+            if op not in handlers:
+                raise ValueError(f"Unknown batch operation: {op!r}")
+            calls.append((handlers[op], kwargs))
+        
+        if not calls:
+            return []
+        
+        def run(call):
+            func, kwargs = call
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(len(calls), POOL_MAXSIZE)) as executor:
+            return list(executor.map(run, calls))
     
     def get_recent_readings(self, count: int = 100) -> pd.DataFrame:
         """
@@ -83,24 +275,12 @@ class SensorDataReader:
             response = self.session.get(
                 f"{self.api_url}/data/recent",
                 params=params,
+                headers={'Accept': READINGS_ACCEPT},
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            data = response.json()
-            if 'error' in data:
-                raise RuntimeError(f"API error: {data['error']}")
-            
-            # Convert to DataFrame
-            readings = data.get('readings', [])
-            if not readings:
-                return pd.DataFrame(columns=['timestamp', 'co2_ppm', 'temperature_c', 'humidity_percent', 'quality_flags'])
-            
-            # Parse timestamps
-            for reading in readings:
-                reading['timestamp'] = pd.to_datetime(reading['timestamp'])
-            
-            return pd.DataFrame(readings)
+            return _response_to_dataframe(response)
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to retrieve recent readings: {e}")
@@ -116,7 +296,8 @@ class SensorDataReader:
             end: End datetime (inclusive)
             
         Returns:
-            pandas DataFrame with readings in the specified time range
+            pandas DataFrame with readings in the specified time range,
+            sorted ascending by timestamp
             
         Raises:
             ValueError: If start is after end
@@ -133,29 +314,65 @@ class SensorDataReader:
             response = self.session.get(
                 f"{self.api_url}/data/range",
                 params=params,
+                headers={'Accept': READINGS_ACCEPT},
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            data = response.json()
-            if 'error' in data:
-                raise RuntimeError(f"API error: {data['error']}")
-            
-            # Convert to DataFrame
-            readings = data.get('readings', [])
-            if not readings:
-                return pd.DataFrame(columns=['timestamp', 'co2_ppm', 'temperature_c', 'humidity_percent', 'quality_flags'])
-            
-            # Parse timestamps
-            for reading in readings:
-                reading['timestamp'] = pd.to_datetime(reading['timestamp'])
-            
-            return pd.DataFrame(readings)
+            df = _response_to_dataframe(response)
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to retrieve readings in range: {e}")
         except (KeyError, ValueError) as e:
             raise RuntimeError(f"Invalid API response format: {e}")
+        
+        # The daemon scans keys in timestamp order, so this is normally a
+        # no-op check; callers rely on sorted rows
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='stable', ignore_index=True)
+        return df
+    
+    def iter_readings_range(self, start: datetime, end: datetime,
+                            window: timedelta = RANGE_WINDOW) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over sensor readings within a time range in chunks.
+        
+        The range is split into consecutive windows that are fetched one at
+        a time, so only one window's readings are held in memory and the
+        first chunk is available without waiting for the whole query.
+        Readings on a window boundary are yielded only once.
+        
+        Args:
+            start: Start datetime (inclusive)
+            end: End datetime (inclusive)
+            window: Time span fetched per request (default: 1 hour)
+            
+        Yields:
+            pandas DataFrames of readings, sorted ascending by timestamp;
+            windows without readings are skipped
+            
+        Raises:
+            ValueError: If start is after end or window is not positive
+            RuntimeError: If API request fails
+        """
+        if start >= end:
+            raise ValueError("Start time must be before end time")
+        if window <= timedelta(0):
+            raise ValueError("Window must be positive")
+        
+        last_timestamp = None
+        window_start = start
+        while window_start < end:
+            window_end = min(window_start + window, end)
+            chunk = self.get_readings_range(window_start, window_end)
+            
+            if last_timestamp is not None and not chunk.empty:
+                chunk = chunk[chunk['timestamp'] > last_timestamp]
+            if not chunk.empty:
+                last_timestamp = chunk['timestamp'].iloc[-1]
+                yield chunk
+            
+            window_start = window_end
     
     def get_aggregates(self, start: datetime, end: datetime, 
                       interval: str = "1H") -> pd.DataFrame:
@@ -191,7 +408,7 @@ class SensorDataReader:
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = _parse_json(response)
             if 'error' in data:
                 raise RuntimeError(f"API error: {data['error']}")
             
@@ -200,11 +417,7 @@ class SensorDataReader:
             if not aggregates:
                 return pd.DataFrame()
             
-            # Parse timestamps
-            for aggregate in aggregates:
-                aggregate['timestamp'] = pd.to_datetime(aggregate['timestamp'])
-            
-            return pd.DataFrame(aggregates)
+            return _parse_timestamps(pd.DataFrame.from_records(aggregates))
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to compute aggregates: {e}")
@@ -235,7 +448,7 @@ class SensorDataReader:
             response = self.session.get(f"{self.api_url}/data/info", timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _parse_json(response)
             if 'error' in data:
                 raise RuntimeError(f"API error: {data['error']}")
             
@@ -11,10 +11,16 @@ cannot be installed.
 """
 
 import os
+import shutil
 import struct
 import subprocess
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import threading
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
+import numpy as np
 import pandas as pd
 
 try:
@@ -23,6 +29,23 @@ try:
 except ImportError:
     ROCKSDB_PYTHON_AVAILABLE = False
 
+try:
+    from google.protobuf.internal import api_implementation
+    from google.protobuf.message import DecodeError
+    PROTOBUF_IMPLEMENTATION = api_implementation.Type()
+except ImportError:
+    DecodeError = ValueError
+    PROTOBUF_IMPLEMENTATION = None
+
+if PROTOBUF_IMPLEMENTATION == 'python':
+    warnings.warn(
+        "protobuf is running its pure-Python backend, which parses readings "
+        "much more slowly. Install protobuf>=4.21 wheels and leave "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION unset to use the native one.",
+        RuntimeWarning,
+        stacklevel=2
+    )
+
 try:
     from . import sensor_data_pb2
 except ImportError:
@@ -31,6 +54,134 @@ except ImportError:
         "from the proto file."
     )
 
+# Field descriptors looked up once; ListFields() pairs are keyed by them
+_FIELDS_BY_NAME = sensor_data_pb2.SensorReading.DESCRIPTOR.fields_by_name
+_CO2_FIELD = _FIELDS_BY_NAME['co2_ppm']
+_TEMPERATURE_FIELD = _FIELDS_BY_NAME['temperature_c']
+_HUMIDITY_FIELD = _FIELDS_BY_NAME['humidity_percent']
+_QUALITY_FLAGS_FIELD = _FIELDS_BY_NAME['quality_flags']
+
+# Codec for the 8-byte big-endian microsecond timestamp keys
+_KEY_STRUCT = struct.Struct('>Q')
+
+# Keys count microseconds from here; integer timedelta arithmetic keeps
+# conversions exact where float seconds would round
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Wire layout the daemon writes for a complete reading: timestamp_us as an
+# 8-byte varint (1), the three sensor floats (2-4) and quality_flags as a
+# 1-byte varint (5). Such values are unpacked directly; anything else goes
+# through protobuf.
+_FULL_READING_STRUCT = struct.Struct('<B7sBBfBfBfBB')
+_FULL_READING_TAGS = (0x08, 0x15, 0x1d, 0x25, 0x28)
+_VARINT_CONTINUATION = 0x80808080808080
+
+# DB options for the point-lookup workload, applied when the binding exposes
+# them: mmap'ed SST reads skip a pread copy per block, and keeping every
+# table file open avoids reopening files on a Get
+READ_DB_OPTIONS = {
+    'allow_mmap_reads': True,
+    'max_open_files': -1,
+}
+
+# Raw reading as returned by _parse_sensor_reading_raw: (timestamp_us,
+# co2_ppm, temperature_c, humidity_percent, quality_flags)
+RawReading = Tuple[int, Optional[float], Optional[float], Optional[float], int]
+
+class SensorRow(NamedTuple):
+    """A single sensor reading, as returned by get_single_reading()."""
+    
+    timestamp: datetime
+    co2_ppm: Optional[float]
+    temperature_c: Optional[float]
+    humidity_percent: Optional[float]
+    quality_flags: int
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the reading as a plain dictionary keyed by field name."""
+        return dict(zip(self._fields, self))
+
+
+# Seconds a daemon status probe result is reused before probing again
+STATUS_TTL = 2.0
+
+# systemd unit and process name (/proc/<pid>/comm) of the daemon
+DAEMON_UNIT = 'sensor-daemon.service'
+DAEMON_COMM = b'sensor-daemon'
+
+
+def _unpack_full_reading(value: bytes) -> Optional[Tuple[float, float, float, int]]:
+    """
+    Decode a complete reading without protobuf.
+    
+    Args:
+        value: Protobuf-encoded sensor reading
+        
+    Returns:
+        Tuple of (co2_ppm, temperature_c, humidity_percent, quality_flags),
+        or None when the value does not have the full reading layout
+    """
+    if len(value) != _FULL_READING_STRUCT.size:
+        return None
+    
+    (timestamp_tag, timestamp_head, timestamp_last, co2_tag, co2, temperature_tag,
+     temperature, humidity_tag, humidity, flags_tag, flags) = _FULL_READING_STRUCT.unpack(value)
+    if ((timestamp_tag, co2_tag, temperature_tag, humidity_tag, flags_tag) != _FULL_READING_TAGS
+            or int.from_bytes(timestamp_head, 'little') & _VARINT_CONTINUATION != _VARINT_CONTINUATION
+            or timestamp_last & 0x80 or flags & 0x80):
+        return None
+    
+    return co2, temperature, humidity, flags
+
+
+@lru_cache(maxsize=None)
+def _command_path(name: str) -> str:
+    """
+    Resolve a command on PATH once.
+    
+    An absolute path lets subprocess start the command with posix_spawn
+    (a bare name always goes through fork/exec).
+    
+    Args:
+        name: Command name
+        
+    Returns:
+        Absolute path of the command, or the bare name if it is not on PATH
+    """
+    return shutil.which(name) or name
+
+
+def _probe_daemon_running() -> Optional[bool]:
+    """
+    Check for the daemon without starting any subprocess.
+    
+    Returns:
+        True or False when the process table could be inspected, None when
+        neither systemd's runtime state nor /proc is available
+    """
+    # systemd keeps an invocation link for every active unit
+    if os.path.lexists(f'/run/systemd/units/invocation:{DAEMON_UNIT}'):
+        return True
+    
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return None
+    
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, 'comm'), 'rb') as f:
+                    if f.read().rstrip(b'\n') == DAEMON_COMM:
+                        return True
+            except OSError:
+                continue  # Process exited or is not readable
+    
+    return False
+
 
 class SimpleSensorDataReader:
     """
@@ -40,12 +191,15 @@ class SimpleSensorDataReader:
     for time-series queries. Use the main SensorDataReader when possible.
     """
     
-    def __init__(self, db_path: str = "/var/lib/sensor-daemon/data"):
+    def __init__(self, db_path: str = "/var/lib/sensor-daemon/data",
+                 status_ttl: float = STATUS_TTL):
         """
         Initialize the SimpleSensorDataReader.
         
         Args:
             db_path: Path to the RocksDB database directory
+            status_ttl: Seconds an is_daemon_running() result is reused
+                (0 probes on every call)
             
         Raises:
             ImportError: If rocksdb-python is not available
@@ -61,6 +215,13 @@ class SimpleSensorDataReader:
         self.db_path = db_path
         self._db = None
         
+        # Per-thread scratch messages (see _reading)
+        self._local = threading.local()
+        
+        # (monotonic time of last probe, result) for is_daemon_running
+        self.status_ttl = status_ttl
+        self._status_cache = (float('-inf'), False)
+        
         if not os.path.exists(db_path):
             raise FileNotFoundError(f"Database path does not exist: {db_path}")
         
@@ -68,8 +229,13 @@ class SimpleSensorDataReader:
             # Open database in read-only mode
             opts = Options()
             opts.create_if_missing = False
+            for name, value in READ_DB_OPTIONS.items():
+                if hasattr(opts, name):
+                    setattr(opts, name, value)
             # Note: rocksdb-python doesn't support read_only parameter
             self._db = PyDB(opts, db_path)
+            # Shared by every lookup instead of allocating one per call
+            self._read_opts = ReadOptions()
         except Exception as e:
             raise RuntimeError(f"Failed to open database: {e}")
     
@@ -87,6 +253,20 @@ class SimpleSensorDataReader:
             del self._db
             self._db = None
     
+    @property
+    def _reading(self) -> 'sensor_data_pb2.SensorReading':
+        """
+        Scratch message of the calling thread.
+        
+        Every parse on a thread decodes into the same message instead of
+        allocating one per row; threads get their own so concurrent lookups
+        never share one.
+        """
+        reading = getattr(self._local, 'reading', None)
+        if reading is None:
+            reading = self._local.reading = sensor_data_pb2.SensorReading()
+        return reading
+    
     def _timestamp_to_key(self, timestamp: datetime) -> bytes:
         """
         Convert datetime to RocksDB key format.
@@ -97,10 +277,37 @@ class SimpleSensorDataReader:
         Returns:
             8-byte big-endian timestamp key
         """
-        # Convert to microseconds since Unix epoch
-        timestamp_us = int(timestamp.timestamp() * 1_000_000)
+        # Convert to microseconds since Unix epoch (naive values are local
+        # time, as with datetime.timestamp())
+        timestamp_us = (timestamp.astimezone(timezone.utc) - _EPOCH) // _MICROSECOND
         # Pack as big-endian 64-bit unsigned integer for proper ordering
-        return struct.pack('>Q', timestamp_us)
+        return _KEY_STRUCT.pack(timestamp_us)
+    
+    def _timestamps_to_keys(self, timestamps: pd.DatetimeIndex) -> List[bytes]:
+        """
+        Convert many datetimes to RocksDB key format in one vectorized pass.
+        
+        Batch counterpart of _timestamp_to_key for multi-key lookups. Naive
+        timestamps are local time, as in _timestamp_to_key.
+        
+        Args:
+            timestamps: Timestamps to convert
+            
+        Returns:
+            List of 8-byte big-endian timestamp keys, in input order
+        """
+        timestamps = pd.DatetimeIndex(timestamps)
+        if timestamps.tz is None:
+            # Resolve local time with datetime.astimezone() so DST gaps and
+            # repeated hours map to the same keys as _timestamp_to_key
+            timestamps = pd.to_datetime(
+                [ts.astimezone(timezone.utc) for ts in timestamps.to_pydatetime()],
+                utc=True
+            )
+        # datetime64 values are UTC regardless of the index timezone
+        timestamps_us = timestamps.values.astype('datetime64[us]').view(np.int64)
+        packed = timestamps_us.astype('>u8').tobytes()
+        return [packed[i:i + 8] for i in range(0, len(packed), 8)]
     
     def _key_to_timestamp(self, key: bytes) -> datetime:
         """
@@ -112,10 +319,56 @@ class SimpleSensorDataReader:
         Returns:
             Datetime object in UTC
         """
-        timestamp_us = struct.unpack('>Q', key)[0]
-        return datetime.fromtimestamp(timestamp_us / 1_000_000, tz=timezone.utc)
+        timestamp_us = _KEY_STRUCT.unpack_from(key)[0]
+        return _EPOCH + timedelta(microseconds=timestamp_us)
+    
+    def _keys_to_timestamps(self, keys: List[bytes]) -> pd.DatetimeIndex:
+        """
+        Convert many RocksDB keys to timestamps in one vectorized pass.
+        
+        Args:
+            keys: List of 8-byte big-endian timestamp keys
+            
+        Returns:
+            DatetimeIndex in UTC, in input order
+        """
+        timestamps_us = np.frombuffer(b''.join(keys), dtype='>u8').astype(np.int64)
+        return pd.to_datetime(timestamps_us, unit='us', utc=True)
     
-    def _parse_sensor_reading(self, key: bytes, value: bytes) -> Dict[str, Any]:
+    def _parse_sensor_reading_raw(self, key: bytes, value: bytes) -> RawReading:
+        """
+        Parse a sensor reading into plain values, without building a datetime.
+        
+        Args:
+            key: RocksDB key (timestamp)
+            value: Protobuf-encoded sensor reading
+            
+        Returns:
+            Tuple of (timestamp_us, co2_ppm, temperature_c, humidity_percent,
+            quality_flags), with None for unset sensor fields
+            
+        Raises:
+            DecodeError: If the value is not a valid SensorReading
+        """
+        timestamp_us = _KEY_STRUCT.unpack_from(key)[0]
+        unpacked = _unpack_full_reading(value)
+        if unpacked is not None:
+            return (timestamp_us,) + unpacked
+        
+        reading = self._reading
+        reading.Clear()
+        reading.MergeFromString(value)
+        fields = dict(reading.ListFields())
+        
+        return (
+            timestamp_us,
+            fields.get(_CO2_FIELD),
+            fields.get(_TEMPERATURE_FIELD),
+            fields.get(_HUMIDITY_FIELD),
+            fields.get(_QUALITY_FLAGS_FIELD, 0),
+        )
+    
+    def _parse_sensor_reading(self, key: bytes, value: bytes) -> SensorRow:
         """
         Parse a sensor reading from RocksDB key-value pair.
         
@@ -124,25 +377,95 @@ class SimpleSensorDataReader:
             value: Protobuf-encoded sensor reading
             
         Returns:
-            Dictionary with parsed sensor data
-        """
-        # Parse protobuf message
-        reading = sensor_data_pb2.SensorReading()
-        reading.ParseFromString(value)
-        
-        # Extract timestamp from key for consistency
-        timestamp = self._key_to_timestamp(key)
-        
-        # Build result dictionary
-        result = {
-            'timestamp': timestamp,
-            'co2_ppm': reading.co2_ppm if reading.HasField('co2_ppm') else None,
-            'temperature_c': reading.temperature_c if reading.HasField('temperature_c') else None,
-            'humidity_percent': reading.humidity_percent if reading.HasField('humidity_percent') else None,
-            'quality_flags': reading.quality_flags
+            SensorRow with parsed sensor data
+            
+        Raises:
+            DecodeError: If the value is not a valid SensorReading
+        """
+        timestamp_us, co2, temperature, humidity, flags = self._parse_sensor_reading_raw(key, value)
+        
+        return SensorRow(_EPOCH + timedelta(microseconds=timestamp_us),
+                         co2, temperature, humidity, flags)
+    
+    def _parse_sensor_columns(self, items: List[Tuple[bytes, bytes]],
+                              errors: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        Parse several sensor readings straight into column arrays.
+        
+        Values are written by index into preallocated NumPy arrays, with NaN
+        for unset sensor fields, so pandas gets typed columns without
+        inferring them from rows. Keys are converted to timestamps in one
+        vectorized pass. Complete readings in the daemon's usual wire
+        layout are unpacked with one struct call; other values are decoded
+        into the same scratch message with the per-row method lookups bound
+        once outside the loop, and their set fields are collected with a
+        single ListFields() call looked up by module-level descriptors.
+        
+        Corrupted values are skipped. The decode loop has no per-row
+        try/except; a decode error ends the pass, and parsing resumes after
+        the bad entry. One warning reports how many entries were skipped.
+        
+        Args:
+            items: List of (key, value) pairs as stored in RocksDB
+            errors: Optional list that receives the indices of skipped items
+            
+        Returns:
+            Dictionary of column name to array (timestamp as a UTC
+            DatetimeIndex), in input order
+        """
+        reading = self._reading
+        clear = reading.Clear
+        merge = reading.MergeFromString
+        list_fields = reading.ListFields
+        unpack_full = _unpack_full_reading
+        
+        n = len(items)
+        co2 = np.full(n, np.nan)
+        temperature = np.full(n, np.nan)
+        humidity = np.full(n, np.nan)
+        flags = np.zeros(n, dtype=np.int64)
+        nan = np.nan
+        
+        skipped = [] if errors is None else errors
+        first_error = len(skipped)
+        position = 0
+        while position < n:
+            try:
+                for index in range(position, n):
+                    position = index + 1
+                    value = items[index][1]
+                    unpacked = unpack_full(value)
+                    if unpacked is not None:
+                        co2[index], temperature[index], humidity[index], flags[index] = unpacked
+                        continue
+                    
+                    clear()
+                    merge(value)
+                    fields = dict(list_fields())
+                    
+                    co2[index] = fields.get(_CO2_FIELD, nan)
+                    temperature[index] = fields.get(_TEMPERATURE_FIELD, nan)
+                    humidity[index] = fields.get(_HUMIDITY_FIELD, nan)
+                    flags[index] = fields.get(_QUALITY_FLAGS_FIELD, 0)
+            except DecodeError:
+                skipped.append(position - 1)
+        
+        columns = {
+            'timestamp': self._keys_to_timestamps([key for key, _ in items]),
+            'co2_ppm': co2,
+            'temperature_c': temperature,
+            'humidity_percent': humidity,
+            'quality_flags': flags,
         }
         
-        return result
+        bad = skipped[first_error:]
+        if bad:
+            warnings.warn(f"Skipped {len(bad)} corrupted sensor readings", RuntimeWarning)
+            valid = np.ones(n, dtype=bool)
+            valid[bad] = False
+            columns = {name: column[valid] for name, column in columns.items()}
+        
+        return columns
     
     def get_recent_readings(self, count: int = 100) -> pd.DataFrame:
         """
@@ -215,7 +538,7 @@ class SimpleSensorDataReader:
             "efficiently implementable with rocksdb-python. Please use python-rocksdb instead."
         )
     
-    def get_single_reading(self, timestamp: datetime) -> Optional[Dict[str, Any]]:
+    def get_single_reading(self, timestamp: datetime) -> Optional[SensorRow]:
         """
         Get a single reading by exact timestamp.
         
@@ -225,15 +548,15 @@ class SimpleSensorDataReader:
             timestamp: Exact timestamp to look up
             
         Returns:
-            Dictionary with sensor data or None if not found
+            SensorRow with sensor data (as_dict() gives a dictionary), or
+            None if not found
         """
         if not self._db:
             raise RuntimeError("Database is not open")
         
         try:
             key = self._timestamp_to_key(timestamp)
-            read_opts = ReadOptions()
-            value = self._db.Get(read_opts, key)
+            value = self._db.Get(self._read_opts, key)
             
             return self._parse_sensor_reading(key, value)
             
@@ -243,29 +566,142 @@ class SimpleSensorDataReader:
                 return None
             raise RuntimeError(f"Failed to retrieve reading: {e}")
     
+    def _multi_get(self, read_opts, keys: List[bytes]) -> Tuple[List[int], List[Tuple[bytes, bytes]]]:
+        """
+        Look up several keys, in one MultiGet call when the binding has it.
+        
+        Args:
+            read_opts: ReadOptions for the lookups
+            keys: Keys to look up
+            
+        Returns:
+            Tuple of (positions in keys that were found, (key, value) pairs)
+            
+        Raises:
+            RuntimeError: If database access fails
+        """
+        positions = []
+        items = []
+        
+        multi_get = getattr(self._db, 'MultiGet', None)
+        if multi_get is not None:
+            try:
+                values = multi_get(read_opts, keys)
+            except RuntimeError as e:
+                raise RuntimeError(f"Failed to retrieve readings: {e}")
+            for position, (key, value) in enumerate(zip(keys, values)):
+                # Missing keys come back as None
+                if value is not None:
+                    positions.append(position)
+                    items.append((key, value))
+            return positions, items
+        
+        get = self._db.Get
+        for position, key in enumerate(keys):
+            try:
+                value = get(read_opts, key)
+            except RuntimeError as e:
+                # RocksDB throws RuntimeError for key not found
+                if "NotFound" in str(e):
+                    continue
+                raise RuntimeError(f"Failed to retrieve reading: {e}")
+            positions.append(position)
+            items.append((key, value))
+        return positions, items
+    
+    def get_readings_at(self, timestamps: List[datetime]) -> pd.DataFrame:
+        """
+        Get the readings stored at several exact timestamps.
+        
+        Keys are encoded in one vectorized pass, looked up with a single
+        MultiGet when the binding provides one, and all found values are
+        parsed as one batch. Naive timestamps are local time, as in
+        get_single_reading().
+        
+        Args:
+            timestamps: Exact timestamps to look up
+            
+        Returns:
+            pandas DataFrame with one row per requested timestamp, in request
+            order; sensor values are NaN for timestamps without a reading
+            
+        Raises:
+            RuntimeError: If database access fails
+        """
+        if not self._db:
+            raise RuntimeError("Database is not open")
+        
+        keys = self._timestamps_to_keys(pd.DatetimeIndex(timestamps))
+        positions, items = self._multi_get(self._read_opts, keys)
+        
+        n = len(keys)
+        columns = {
+            'timestamp': self._keys_to_timestamps(keys),
+            'co2_ppm': np.full(n, np.nan),
+            'temperature_c': np.full(n, np.nan),
+            'humidity_percent': np.full(n, np.nan),
+            'quality_flags': np.zeros(n, dtype=np.int64),
+        }
+        if items:
+            errors = []
+            parsed = self._parse_sensor_columns(items, errors)
+            # Corrupted values are left as missing readings
+            positions = np.delete(np.asarray(positions, dtype=np.intp), errors)
+            for column in ('co2_ppm', 'temperature_c', 'humidity_percent', 'quality_flags'):
+                columns[column][positions] = parsed[column]
+        
+        return pd.DataFrame(columns, copy=False)
+    
     def is_daemon_running(self) -> bool:
         """
         Check if the sensor daemon is currently running.
         
+        The result is cached for status_ttl seconds. Probes read systemd's
+        runtime state and /proc directly; systemctl and pgrep are only run
+        when neither is available.
+        
         Returns:
             True if the daemon is running, False otherwise
         """
+        checked_at, is_running = self._status_cache
+        now = time.monotonic()
+        if now - checked_at < self.status_ttl:
+            return is_running
+        
+        is_running = _probe_daemon_running()
+        if is_running is None:
+            is_running = self._probe_daemon_running_subprocess()
+        
+        self._status_cache = (now, is_running)
+        return is_running
+    
+    def _probe_daemon_running_subprocess(self) -> bool:
+        """
+        Check for the daemon with systemctl, falling back to pgrep.
+        
+        Both are started by absolute path with close_fds=False, which lets
+        CPython use posix_spawn instead of fork plus closing descriptors in
+        the child. The reader's own descriptors are opened close-on-exec,
+        so nothing leaks into the commands.
+        """
         try:
             # Check systemd service status
             result = subprocess.run(
-                ['systemctl', 'is-active', 'sensor-daemon'],
+                [_command_path('systemctl'), 'is-active', 'sensor-daemon'],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=5,
+                close_fds=False
             )
             return result.returncode == 0 and result.stdout.strip() == 'active'
         except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
             # Fallback: check if process exists
             try:
                 result = subprocess.run(
-                    ['pgrep', '-f', 'sensor-daemon'],
+                    [_command_path('pgrep'), '-f', 'sensor-daemon'],
                     capture_output=True,
-                    timeout=5
+                    timeout=5,
+                    close_fds=False
                 )
                 return result.returncode == 0
             except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
@@ -6,6 +6,22 @@
 # This is a placeholder file that would normally be generated by protoc
 # In a real deployment, run: protoc --python_out=. ../proto/sensor_data.proto
 
+class _FieldDescriptor:
+    """Placeholder for a protobuf FieldDescriptor (name and number only)."""
+    
+    def __init__(self, name, number):
+        self.name = name
+        self.number = number
+
+
+class _Descriptor:
+    """Placeholder for a protobuf message Descriptor (fields only)."""
+    
+    def __init__(self, fields):
+        self.fields = list(fields)
+        self.fields_by_name = {field.name: field for field in self.fields}
+
+
 class SensorReading:
     """
     Placeholder for protobuf SensorReading message.
@@ -13,6 +29,10 @@ class SensorReading:
     """
     
     def __init__(self):
+        self.Clear()
+    
+    def Clear(self):
+        """Reset all fields to their defaults."""
         self.timestamp_us = 0
         self.co2_ppm = None
         self.temperature_c = None
@@ -24,12 +44,38 @@ class SensorReading:
     
     def ParseFromString(self, data):
         """Parse protobuf data (placeholder implementation)."""
+        self.Clear()
+        return self.MergeFromString(data)
+    
+    def MergeFromString(self, data):
+        """Merge protobuf data into this message (placeholder implementation)."""
         # This is a simplified placeholder
         # Real implementation would parse binary protobuf data
         import struct
         if len(data) >= 8:
             self.timestamp_us = struct.unpack('>Q', data[:8])[0]
-        pass
+        return len(data)
+    
+    _FIELDS = (
+        _FieldDescriptor('timestamp_us', 1),
+        _FieldDescriptor('co2_ppm', 2),
+        _FieldDescriptor('temperature_c', 3),
+        _FieldDescriptor('humidity_percent', 4),
+        _FieldDescriptor('quality_flags', 5),
+    )
+    
+    def ListFields(self):
+        """List (descriptor, value) pairs of the fields that are set."""
+        fields = []
+        for field in self._FIELDS:
+            if field.name in ('co2_ppm', 'temperature_c', 'humidity_percent'):
+                is_set = self.HasField(field.name)
+            else:
+                # Implicit-presence scalars count as set when non-zero
+                is_set = bool(getattr(self, field.name))
+            if is_set:
+                fields.append((field, getattr(self, field.name)))
+        return fields
     
     def HasField(self, field_name):
         """Check if optional field is set."""
@@ -39,4 +85,7 @@ class SensorReading:
             return self._has_temperature_c
         elif field_name == 'humidity_percent':
             return self._has_humidity_percent
-        return False
\ No newline at end of file
+        return False
+
+
+SensorReading.DESCRIPTOR = _Descriptor(SensorReading._FIELDS)
@@ -30,10 +30,21 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
+        "numpy>=1.17.3",
         "pandas>=1.3.0",
         "requests>=2.25.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.0",
+        ],
+        "unix": [
+            "requests-unixsocket>=0.3",
+        ],
+        "protobuf": [
+            # 4.21+ parses with the native upb backend by default
+            "protobuf>=4.21",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
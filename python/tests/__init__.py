@@ -1 +1,11 @@
-# Test package for sensor_daemon Python interface
\ No newline at end of file
+# Test package for sensor_daemon Python interface
+
+import sys
+from unittest.mock import MagicMock
+
+# Mock rocksdb since it may not be available in test environment. Installed
+# here rather than in a pytest conftest so that both pytest and
+# `python -m unittest discover` set it up before any test module imports
+# sensor_daemon.
+if 'rocksdb' not in sys.modules:
+    sys.modules['rocksdb'] = MagicMock()
@@ -0,0 +1,137 @@
+"""
+Unit tests for CachedSensorDataReader class.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+import pandas as pd
+
+from sensor_daemon.cache import CachedSensorDataReader
+
+
+class TestCachedSensorDataReader(unittest.TestCase):
+    """Test cases for CachedSensorDataReader class."""
+    
+    def setUp(self):
+        """Set up a cached reader with a mocked HTTP layer."""
+        patcher = patch('sensor_daemon.reader.requests.Session')
+        mock_session_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        mock_session = mock_session_class.return_value
+        mock_session.headers = {}
+        mock_session.get.return_value = MagicMock(status_code=200)
+        
+        self.frame = pd.DataFrame({
+            'timestamp': pd.to_datetime(['2024-01-01T12:10:00Z', '2024-01-01T12:20:00Z']),
+            'co2_ppm': [400.0, 410.0],
+        })
+        range_patcher = patch('sensor_daemon.reader.SensorDataReader.get_readings_range',
+                              return_value=self.frame)
+        self.mock_range = range_patcher.start()
+        self.addCleanup(range_patcher.stop)
+        
+        self.reader = CachedSensorDataReader("http://localhost:8080")
+    
+    def test_same_minute_hits_cache(self):
+        """Test that windows within the same minute share one request."""
+        start = datetime(2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 13, 0, 5, tzinfo=timezone.utc)
+        
+        self.reader.get_readings_range(start, end)
+        self.reader.get_readings_range(start.replace(second=40), end.replace(second=40))
+        
+        self.mock_range.assert_called_once_with(
+            datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 13, 1, tzinfo=timezone.utc)
+        )
+    
+    def test_cached_frame_is_copied(self):
+        """Test that modifying a returned frame does not affect the cache."""
+        start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+        
+        first = self.reader.get_readings_range(start, end)
+        first['hour'] = 12
+        second = self.reader.get_readings_range(start, end)
+        
+        self.assertNotIn('hour', second.columns)
+    
+    def test_contained_range_is_sliced(self):
+        """Test that a window inside the last fetched range needs no request."""
+        start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 14, 0, tzinfo=timezone.utc)
+        self.mock_range.return_value = pd.DataFrame({
+            'timestamp': pd.date_range(start, end, freq='30min'),
+            'co2_ppm': [400.0, 405.0, 410.0, 415.0, 420.0],
+        })
+        
+        self.reader.get_readings_range(start, end)
+        result = self.reader.get_readings_range(datetime(2024, 1, 1, 12, 30),
+                                                datetime(2024, 1, 1, 13, 30))
+        
+        self.mock_range.assert_called_once()
+        self.assertEqual(result['co2_ppm'].tolist(), [405.0, 410.0, 415.0])
+    
+    def test_widened_window_is_trimmed(self):
+        """Test that readings outside the requested times are not returned."""
+        start = datetime(2024, 1, 1, 12, 10, 30, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        
+        result = self.reader.get_readings_range(start, end)
+        
+        self.mock_range.assert_called_once_with(
+            datetime(2024, 1, 1, 12, 10, tzinfo=timezone.utc), end
+        )
+        self.assertEqual(result['co2_ppm'].tolist(), [410.0])
+    
+    def test_live_window_is_not_cached(self):
+        """Test that windows reaching the current minute always query the daemon."""
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(hours=1)
+        
+        self.reader.get_readings_range(start, end)
+        self.reader.get_readings_range(start, end)
+        
+        self.assertEqual(self.mock_range.call_count, 2)
+        self.mock_range.assert_called_with(start, end)
+    
+    def test_capped_range_is_not_sliced(self):
+        """Test that a response at the daemon's result limit is not reused for sub-ranges."""
+        start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 14, 0, tzinfo=timezone.utc)
+        self.mock_range.return_value = pd.DataFrame({
+            'timestamp': pd.date_range(start, end, freq='30min'),
+            'co2_ppm': [400.0, 405.0, 410.0, 415.0, 420.0],
+        })
+        
+        with patch('sensor_daemon.cache.RANGE_RESULT_LIMIT', 5):
+            self.reader.get_readings_range(start, end)
+            self.reader.get_readings_range(datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+                                           datetime(2024, 1, 1, 13, 30, tzinfo=timezone.utc))
+        
+        self.assertEqual(self.mock_range.call_count, 2)
+    
+    def test_invalidate(self):
+        """Test that invalidate forces a new request."""
+        start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+        
+        self.reader.get_readings_range(start, end)
+        self.reader.invalidate()
+        self.reader.get_readings_range(start, end)
+        
+        self.assertEqual(self.mock_range.call_count, 2)
+    
+    def test_invalid_range(self):
+        """Test that reversed ranges are rejected before rounding."""
+        start = datetime(2024, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, 12, 0, 10, tzinfo=timezone.utc)
+        
+        with self.assertRaises(ValueError):
+            self.reader.get_readings_range(start, end)
+
+
+if __name__ == '__main__':
+    unittest.main()
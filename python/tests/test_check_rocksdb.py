@@ -0,0 +1,112 @@
+"""
+Unit tests for the check_rocksdb binding probes and their result cache.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from sensor_daemon import check_rocksdb
+
+
+FINGERPRINT = {'python': '/usr/bin/python3', 'libraries': {}, 'bindings': {}}
+
+
+class TestProbeBindings(unittest.TestCase):
+    """Test cases for probe_bindings and its on-disk cache."""
+    
+    def setUp(self):
+        """Point the cache at a temporary file and fix the fingerprint."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_file = os.path.join(tmpdir.name, 'sensor_daemon', 'rocksdb_check.json')
+        
+        patchers = [
+            patch.object(check_rocksdb, 'CACHE_FILE', self.cache_file),
+            patch.object(check_rocksdb, '_fingerprint', return_value=FINGERPRINT),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        check_rocksdb.probe_bindings.cache_clear()
+        self.addCleanup(check_rocksdb.probe_bindings.cache_clear)
+    
+    def _write_cache(self, content):
+        """Write raw content to the cache file."""
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+    
+    @patch('sensor_daemon.check_rocksdb.subprocess.run')
+    def test_cache_miss_probes_and_writes(self, mock_run):
+        """Test that a missing cache file runs every probe and stores the results."""
+        mock_run.return_value = MagicMock(returncode=0, stdout='0.8.0\n', stderr='')
+        
+        results = check_rocksdb.probe_bindings()
+        
+        self.assertEqual(mock_run.call_count, len(check_rocksdb.BINDING_PROBES))
+        self.assertEqual(results['rocksdb'], {'available': True, 'working': True, 'detail': '0.8.0'})
+        with open(self.cache_file, encoding='utf-8') as f:
+            cached = json.load(f)
+        self.assertEqual(cached, {'fingerprint': FINGERPRINT, 'results': results})
+    
+    @patch('sensor_daemon.check_rocksdb.subprocess.run')
+    def test_cache_hit_skips_probes(self, mock_run):
+        """Test that a cache file with a matching fingerprint is reused."""
+        results = {'rocksdb': {'available': False, 'working': False, 'detail': 'missing'}}
+        self._write_cache(json.dumps({'fingerprint': FINGERPRINT, 'results': results}))
+        
+        self.assertEqual(check_rocksdb.probe_bindings(), results)
+        mock_run.assert_not_called()
+    
+    @patch('sensor_daemon.check_rocksdb.subprocess.run')
+    def test_stale_cache_is_reprobed(self, mock_run):
+        """Test that a cache file from other libraries or bindings is ignored."""
+        stale = dict(FINGERPRINT, python='/usr/bin/python2')
+        self._write_cache(json.dumps({'fingerprint': stale, 'results': {}}))
+        mock_run.return_value = MagicMock(returncode=0, stdout='unknown\n', stderr='')
+        
+        results = check_rocksdb.probe_bindings()
+        
+        self.assertEqual(mock_run.call_count, len(check_rocksdb.BINDING_PROBES))
+        self.assertTrue(results['rocksdb_python']['working'])
+    
+    @patch('sensor_daemon.check_rocksdb.subprocess.run')
+    def test_corrupt_cache_is_reprobed(self, mock_run):
+        """Test that an unreadable cache file is replaced by fresh results."""
+        self._write_cache('{not json')
+        mock_run.return_value = MagicMock(returncode=0, stdout='unknown\n', stderr='')
+        
+        results = check_rocksdb.probe_bindings()
+        
+        self.assertEqual(mock_run.call_count, len(check_rocksdb.BINDING_PROBES))
+        with open(self.cache_file, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['results'], results)
+    
+    @patch('sensor_daemon.check_rocksdb.subprocess.run')
+    def test_probe_failures(self, mock_run):
+        """Test that import failures, broken bindings and timeouts are reported."""
+        mock_run.side_effect = [
+            MagicMock(returncode=2, stdout="No module named 'rocksdb'\n", stderr=''),
+            MagicMock(returncode=1, stdout='', stderr='Traceback\nOSError: librocksdb.so\n'),
+        ]
+        results = check_rocksdb.probe_bindings()
+        
+        self.assertEqual(results['rocksdb'],
+                         {'available': False, 'working': False, 'detail': "No module named 'rocksdb'"})
+        self.assertEqual(results['rocksdb_python'],
+                         {'available': True, 'working': False, 'detail': 'OSError: librocksdb.so'})
+        
+        mock_run.side_effect = subprocess.TimeoutExpired('python', 5)
+        result = check_rocksdb._probe_binding('rocksdb')
+        
+        self.assertFalse(result['available'])
+        self.assertFalse(result['working'])
+
+
+if __name__ == '__main__':
+    unittest.main()
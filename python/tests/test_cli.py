@@ -7,8 +7,7 @@ from unittest.mock import patch, MagicMock
 import sys
 from io import StringIO
 
-# Mock dependencies
-sys.modules['rocksdb'] = MagicMock()
+# Mock dependencies (rocksdb is mocked in tests/__init__.py)
 sys.modules['sensor_daemon.sensor_data_pb2'] = MagicMock()
 
 from sensor_daemon.cli import main
@@ -54,6 +53,33 @@ class TestCLI(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("Retrieved 1 recent readings", output)
     
+    @patch('sensor_daemon.cli.SensorDataReader')
+    def test_range_command_streams_rows(self, mock_reader_class):
+        """Test that range output keeps one header and fixed columns across chunks."""
+        mock_reader = MagicMock()
+        mock_reader_class.return_value.__enter__.return_value = mock_reader
+        
+        import pandas as pd
+        mock_reader.iter_readings_range.return_value = iter([
+            pd.DataFrame({'timestamp': ['2024-01-01 12:00:00'], 'co2_ppm': [400.0]}),
+            pd.DataFrame({'timestamp': ['2024-01-01 12:30:00'], 'co2_ppm': [1234.5]}),
+        ])
+        
+        sys.argv = ['cli.py', 'range', '--start', '2024-01-01T12:00:00',
+                    '--end', '2024-01-01T13:00:00']
+        
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            result = main()
+        
+        self.assertEqual(result, 0)
+        lines = mock_stdout.getvalue().splitlines()
+        self.assertEqual(lines[1:4], [
+            'timestamp\tco2_ppm',
+            '2024-01-01 12:00:00\t400.0',
+            '2024-01-01 12:30:00\t1234.5',
+        ])
+        self.assertIn("Retrieved 2 readings", lines[4])
+    
     @patch('sensor_daemon.cli.SensorDataReader')
     def test_status_command_running(self, mock_reader_class):
         """Test status command when daemon is running."""
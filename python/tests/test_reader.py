@@ -9,11 +9,6 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import patch, MagicMock
 import pandas as pd
 
-# Mock rocksdb since it may not be available in test environment
-import sys
-from unittest.mock import MagicMock
-sys.modules['rocksdb'] = MagicMock()
-
 from sensor_daemon.reader import SensorDataReader
 
 
@@ -231,6 +226,155 @@ class TestSensorDataReader(unittest.TestCase):
         self.assertEqual(info, expected)
 
 
+class TestSensorDataReaderHTTP(unittest.TestCase):
+    """Test cases for the HTTP-backed SensorDataReader."""
+    
+    def setUp(self):
+        """Set up a reader with a mocked HTTP session."""
+        patcher = patch('sensor_daemon.reader.requests.Session')
+        self.mock_session_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.mock_session = self.mock_session_class.return_value
+        self.mock_session.headers = {}
+        self.mock_session.get.return_value = MagicMock(status_code=200)
+        
+        self.reader = SensorDataReader("http://localhost:8080")
+    
+    def test_session_mounts_pooled_adapter(self):
+        """Test that the session mounts a pooled adapter without asking for keep-alive."""
+        mounted = [call.args[0] for call in self.mock_session.mount.call_args_list]
+        self.assertIn('http://', mounted)
+        self.assertNotIn('Connection', self.mock_session.headers)
+    
+    def test_unix_socket_url(self):
+        """Test that socket paths are percent-encoded into the URL host."""
+        from sensor_daemon.reader import unix_socket_url
+        self.assertEqual(unix_socket_url('/run/sensor.sock'), 'http+unix://%2Frun%2Fsensor.sock')
+    
+    @patch('sensor_daemon.reader.UNIXSOCKET_AVAILABLE', False)
+    def test_unix_socket_requires_adapter(self):
+        """Test that UNIX socket URLs fail clearly without requests-unixsocket."""
+        with self.assertRaises(RuntimeError):
+            SensorDataReader('http+unix://%2Frun%2Fsensor.sock')
+    
+    def _mock_json_response(self, payload):
+        """Configure the session to return a JSON payload."""
+        import json
+        response = MagicMock(status_code=200)
+        response.content = json.dumps(payload).encode()
+        response.json.return_value = payload
+        self.mock_session.get.return_value = response
+    
+    def test_get_recent_readings_typed_columns(self):
+        """Test that readings are returned with fixed columns and dtypes."""
+        self._mock_json_response({'readings': [
+            {'timestamp': '2024-01-01T12:00:00.000Z', 'co2_ppm': 410.5,
+             'temperature_c': 22.1, 'humidity_percent': 45.2, 'quality_flags': 7},
+            {'timestamp': '2024-01-01T12:00:30.000Z', 'quality_flags': 0},
+        ]})
+        
+        result = self.reader.get_recent_readings(2)
+        
+        self.assertEqual(list(result.columns), [
+            'timestamp', 'co2_ppm', 'temperature_c', 'humidity_percent', 'quality_flags'
+        ])
+        self.assertEqual(result['co2_ppm'].dtype, 'float64')
+        self.assertEqual(result['quality_flags'].dtype, 'int64')
+        self.assertTrue(pd.isna(result['co2_ppm'].iloc[1]))
+        self.assertTrue(isinstance(result['timestamp'].dtype, pd.DatetimeTZDtype))
+    
+    def test_get_recent_readings_columns_layout(self):
+        """Test that the column-oriented response decodes to the same frame."""
+        from sensor_daemon.reader import COLUMNS_MEDIA_TYPE
+        self._mock_json_response({'columns': {
+            'timestamp_us': [1704110400000000, 1704110430000000],
+            'co2_ppm': [410.5, None],
+            'temperature_c': [22.1, None],
+            'humidity_percent': [45.2, None],
+            'quality_flags': [7, 0],
+        }, 'total_count': 2})
+        self.mock_session.get.return_value.headers = {'Content-Type': COLUMNS_MEDIA_TYPE}
+        
+        result = self.reader.get_recent_readings(2)
+        
+        self.assertEqual(result['timestamp'].iloc[0], pd.Timestamp('2024-01-01T12:00:00Z'))
+        self.assertEqual(result['co2_ppm'].dtype, 'float64')
+        self.assertTrue(pd.isna(result['co2_ppm'].iloc[1]))
+        self.assertEqual(result['quality_flags'].tolist(), [7, 0])
+        self.assertIn(COLUMNS_MEDIA_TYPE, self.mock_session.get.call_args.kwargs['headers']['Accept'])
+    
+    def test_get_recent_readings_empty(self):
+        """Test that an empty response yields an empty DataFrame."""
+        self._mock_json_response({'readings': []})
+        
+        result = self.reader.get_recent_readings(10)
+        
+        self.assertTrue(result.empty)
+        self.assertIn('co2_ppm', result.columns)
+    
+    def test_get_readings_range_sorts_out_of_order_rows(self):
+        """Test that range rows are returned ascending even if the API is out of order."""
+        self._mock_json_response({'readings': [
+            {'timestamp': '2024-01-01T12:00:30.000Z', 'co2_ppm': 411.0, 'quality_flags': 1},
+            {'timestamp': '2024-01-01T12:00:00.000Z', 'co2_ppm': 410.0, 'quality_flags': 1},
+        ]})
+        
+        result = self.reader.get_readings_range(datetime(2024, 1, 1, 12, 0),
+                                                datetime(2024, 1, 1, 13, 0))
+        
+        self.assertEqual(result['co2_ppm'].tolist(), [410.0, 411.0])
+        self.assertEqual(list(result.index), [0, 1])
+    
+    def test_iter_readings_range_windows(self):
+        """Test that ranges are fetched per window without boundary duplicates."""
+        boundary = pd.Timestamp('2024-01-01T13:00:00Z')
+        chunks = [
+            pd.DataFrame({'timestamp': [pd.Timestamp('2024-01-01T12:30:00Z'), boundary]}),
+            pd.DataFrame({'timestamp': [boundary, pd.Timestamp('2024-01-01T13:30:00Z')]}),
+        ]
+        start = datetime(2024, 1, 1, 12, 0)
+        end = datetime(2024, 1, 1, 14, 0)
+        
+        with patch.object(self.reader, 'get_readings_range', side_effect=chunks) as mock_range:
+            result = list(self.reader.iter_readings_range(start, end))
+        
+        self.assertEqual(mock_range.call_count, 2)
+        mock_range.assert_called_with(datetime(2024, 1, 1, 13, 0), end)
+        self.assertEqual(sum(len(chunk) for chunk in result), 3)
+    
+    def test_batch_preserves_order(self):
+        """Test that batch returns results in request order."""
+        with patch.object(self.reader, 'is_daemon_running', return_value=True), \
+             patch.object(self.reader, 'get_recent_readings', return_value='recent') as mock_recent:
+            results = self.reader.batch([
+                {'op': 'status'},
+                {'op': 'recent', 'count': 10},
+            ])
+        
+        self.assertEqual(results, [True, 'recent'])
+        mock_recent.assert_called_once_with(count=10)
+    
+    def test_batch_returns_exceptions_in_place(self):
+        """Test that a failing operation does not discard the others."""
+        error = RuntimeError("API error")
+        with patch.object(self.reader, 'get_database_info', side_effect=error), \
+             patch.object(self.reader, 'is_daemon_running', return_value=False):
+            results = self.reader.batch([{'op': 'info'}, {'op': 'status'}])
+        
+        self.assertIs(results[0], error)
+        self.assertFalse(results[1])
+    
+    def test_batch_unknown_operation(self):
+        """Test that unknown operations are rejected."""
+        with self.assertRaises(ValueError):
+            self.reader.batch([{'op': 'delete'}])
+    
+    def test_batch_empty(self):
+        """Test batch with no operations."""
+        self.assertEqual(self.reader.batch([]), [])
+
+
 class TestSensorDataReaderIntegration(unittest.TestCase):
     """Integration tests for SensorDataReader (require actual data)."""
     
@@ -0,0 +1,335 @@
+"""
+Unit tests for SimpleSensorDataReader class.
+"""
+
+import os
+import struct
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pandas as pd
+
+import sensor_daemon.reader_simple as reader_simple
+from sensor_daemon.reader_simple import SimpleSensorDataReader
+
+
+@contextmanager
+def local_timezone(name):
+    """Run the block with the process local time zone set to name."""
+    original = os.environ.get('TZ')
+    os.environ['TZ'] = name
+    time.tzset()
+    try:
+        yield
+    finally:
+        if original is None:
+            del os.environ['TZ']
+        else:
+            os.environ['TZ'] = original
+        time.tzset()
+
+
+class TestSimpleSensorDataReader(unittest.TestCase):
+    """Test cases for SimpleSensorDataReader class."""
+    
+    def setUp(self):
+        """Set up a reader with a mocked rocksdb-python database."""
+        patchers = [
+            patch.object(reader_simple, 'ROCKSDB_PYTHON_AVAILABLE', True),
+            patch.object(reader_simple, 'Options', MagicMock(), create=True),
+            patch.object(reader_simple, 'PyDB', MagicMock(), create=True),
+            patch.object(reader_simple, 'ReadOptions', MagicMock(), create=True),
+            patch('sensor_daemon.reader_simple.os.path.exists', return_value=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        self.reader = SimpleSensorDataReader("/test/db")
+    
+    def test_read_db_options_applied(self):
+        """Test that point-lookup options are set on the database options."""
+        opts = reader_simple.Options.return_value
+        
+        self.assertIs(opts.allow_mmap_reads, True)
+        self.assertEqual(opts.max_open_files, -1)
+    
+    def test_read_options_reused(self):
+        """Test that lookups share the ReadOptions created at open."""
+        reader_simple.ReadOptions.reset_mock()
+        
+        self.reader.get_single_reading(datetime(2024, 1, 1, 12, 0))
+        self.reader.get_single_reading(datetime(2024, 1, 1, 12, 1))
+        
+        reader_simple.ReadOptions.assert_not_called()
+        read_opts = self.reader._db.Get.call_args[0][0]
+        self.assertIs(read_opts, reader_simple.ReadOptions.return_value)
+    
+    def test_parse_sensor_columns_timestamps(self):
+        """Test that keys are decoded to UTC timestamps in input order."""
+        keys = [struct.pack('>Q', 1_700_000_000_000_001), struct.pack('>Q', 1_700_000_030_000_000)]
+        
+        columns = self.reader._parse_sensor_columns([(key, b'') for key in keys])
+        
+        self.assertEqual(len(columns['timestamp']), 2)
+        self.assertEqual(columns['timestamp'][0], self.reader._key_to_timestamp(keys[0]))
+        self.assertEqual(columns['timestamp'][0].microsecond, 1)
+        self.assertEqual(columns['timestamp'][1], self.reader._key_to_timestamp(keys[1]))
+        self.assertTrue(np.isnan(columns['co2_ppm'][0]))
+        self.assertEqual(columns['quality_flags'][0], 0)
+    
+    def test_parse_sensor_reading_raw(self):
+        """Test that raw parsing returns integer microseconds and plain values."""
+        key = struct.pack('>Q', 1_700_000_000_000_001)
+        
+        raw = self.reader._parse_sensor_reading_raw(key, b'')
+        
+        self.assertEqual(raw, (1_700_000_000_000_001, None, None, None, 0))
+        self.assertEqual(self.reader._parse_sensor_reading(key, b'').timestamp,
+                         self.reader._key_to_timestamp(key))
+    
+    def test_get_single_reading_row(self):
+        """Test that a single reading is returned as a SensorRow."""
+        key = struct.pack('>Q', 1_700_000_000_000_000)
+        self.reader._db.Get.return_value = b''
+        
+        row = self.reader.get_single_reading(self.reader._key_to_timestamp(key))
+        
+        self.assertIsInstance(row, reader_simple.SensorRow)
+        self.assertEqual(row.timestamp, self.reader._key_to_timestamp(key))
+        self.assertEqual(row.as_dict(), {
+            'timestamp': row.timestamp,
+            'co2_ppm': None,
+            'temperature_c': None,
+            'humidity_percent': None,
+            'quality_flags': 0,
+        })
+    
+    def test_parse_full_reading_without_protobuf(self):
+        """Test that a complete reading is unpacked without the protobuf decoder."""
+        timestamp_us = 1_700_000_000_000_000
+        varint = bytearray()
+        value = timestamp_us
+        while value >= 0x80:
+            varint.append(value & 0x7f | 0x80)
+            value >>= 7
+        varint.append(value)
+        encoded = (b'\x08' + bytes(varint) + b'\x15' + struct.pack('<f', 410.0)
+                   + b'\x1d' + struct.pack('<f', 21.5) + b'\x25' + struct.pack('<f', 45.0)
+                   + b'\x28\x07')
+        key = struct.pack('>Q', timestamp_us)
+        
+        with patch.object(self.reader._reading, 'MergeFromString') as mock_merge:
+            raw = self.reader._parse_sensor_reading_raw(key, encoded)
+            columns = self.reader._parse_sensor_columns([(key, encoded), (key, encoded[:-2])])
+        
+        self.assertEqual(raw, (timestamp_us, 410.0, 21.5, 45.0, 7))
+        mock_merge.assert_called_once_with(encoded[:-2])
+        self.assertEqual(columns['co2_ppm'][0], 410.0)
+        self.assertEqual(columns['quality_flags'][0], 7)
+    
+    def test_parse_sensor_columns_skips_corrupted(self):
+        """Test that a corrupted value is skipped and reported once."""
+        keys = [struct.pack('>Q', 1_700_000_000_000_000 + i) for i in range(3)]
+        errors = []
+        
+        with patch.object(self.reader._reading, 'MergeFromString',
+                          side_effect=[1, reader_simple.DecodeError("bad"), 1]), \
+             self.assertWarns(RuntimeWarning):
+            columns = self.reader._parse_sensor_columns([(key, b'x') for key in keys], errors)
+        
+        self.assertEqual(errors, [1])
+        self.assertEqual(list(columns['timestamp']),
+                         [self.reader._key_to_timestamp(keys[0]), self.reader._key_to_timestamp(keys[2])])
+        self.assertEqual(len(columns['quality_flags']), 2)
+    
+    def test_scratch_message_per_thread(self):
+        """Test that each thread reuses its own scratch message."""
+        other = []
+        with patch.object(reader_simple.sensor_data_pb2, 'SensorReading', side_effect=object):
+            thread = threading.Thread(target=lambda: other.append(self.reader._reading))
+            thread.start()
+            thread.join()
+            
+            self.assertIs(self.reader._reading, self.reader._reading)
+            self.assertIsNot(other[0], self.reader._reading)
+    
+    def test_parse_sensor_columns_typed(self):
+        """Test that columns are typed arrays with NaN for unset fields."""
+        keys = [struct.pack('>Q', 1_700_000_000_000_000), struct.pack('>Q', 1_700_000_030_000_000)]
+        
+        columns = self.reader._parse_sensor_columns([(key, b'') for key in keys])
+        
+        self.assertEqual(columns['co2_ppm'].dtype, np.float64)
+        self.assertTrue(np.isnan(columns['humidity_percent']).all())
+        self.assertEqual(columns['quality_flags'].tolist(), [0, 0])
+        self.assertEqual(list(columns['timestamp']), [self.reader._key_to_timestamp(key) for key in keys])
+    
+    def test_timestamp_key_round_trip_exact(self):
+        """Test that key conversion keeps every microsecond."""
+        timestamp = datetime(2286, 11, 20, 17, 46, 39, 999_999, tzinfo=timezone.utc)
+        
+        key = self.reader._timestamp_to_key(timestamp)
+        
+        self.assertEqual(key, struct.pack('>Q', 9_999_999_999_999_999))
+        self.assertEqual(self.reader._key_to_timestamp(key), timestamp)
+    
+    def test_timestamps_to_keys(self):
+        """Test that batch key encoding matches the single-key encoding."""
+        timestamps = pd.DatetimeIndex([
+            datetime(2024, 1, 1, 12, 0, 0, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 12, 0, 30, tzinfo=timezone.utc),
+        ])
+        
+        keys = self.reader._timestamps_to_keys(timestamps)
+        
+        self.assertEqual(keys, [self.reader._timestamp_to_key(ts) for ts in timestamps])
+        self.assertEqual(self.reader._keys_to_timestamps(keys).tolist(), timestamps.tolist())
+    
+    @unittest.skipUnless(hasattr(time, 'tzset'), "requires time.tzset")
+    def test_timestamps_to_keys_naive_local(self):
+        """Test that naive timestamps are local time in both key helpers."""
+        timestamps = [
+            datetime(2024, 1, 1, 12, 0),
+            datetime(2024, 7, 1, 12, 0, 0, 1),
+            datetime(2023, 11, 5, 1, 30),  # Repeated hour
+            datetime(2023, 3, 12, 2, 30),  # Skipped hour
+        ]
+        
+        with local_timezone('America/New_York'):
+            keys = self.reader._timestamps_to_keys(pd.DatetimeIndex(timestamps))
+            expected = [self.reader._timestamp_to_key(ts) for ts in timestamps]
+        
+        self.assertEqual(keys, expected)
+        self.assertEqual(self.reader._key_to_timestamp(keys[0]),
+                         datetime(2024, 1, 1, 17, 0, tzinfo=timezone.utc))
+    
+    @unittest.skipUnless(hasattr(time, 'tzset'), "requires time.tzset")
+    def test_timestamps_to_keys_naive_nanosecond_index(self):
+        """Test that a nanosecond-unit naive index yields exact microsecond keys."""
+        timestamps = [datetime(2024, 1, 1, 12, 0), datetime(2024, 7, 1, 12, 0, 0, 1)]
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        
+        with local_timezone('America/New_York'):
+            keys = self.reader._timestamps_to_keys(
+                pd.DatetimeIndex(timestamps, dtype='datetime64[ns]'))
+            micros = [(ts.astimezone(timezone.utc) - epoch) // timedelta(microseconds=1)
+                      for ts in timestamps]
+        
+        self.assertEqual(keys, [struct.pack('>Q', us) for us in micros])
+    
+    @unittest.skipUnless(hasattr(time, 'tzset'), "requires time.tzset")
+    def test_get_readings_at_matches_single_lookup(self):
+        """Test that batch and single lookups read the same key for a naive time."""
+        timestamp = datetime(2024, 1, 1, 12, 0)
+        del self.reader._db.MultiGet
+        self.reader._db.Get.return_value = b''
+        
+        with local_timezone('America/New_York'):
+            self.reader.get_single_reading(timestamp)
+            single_key = self.reader._db.Get.call_args[0][1]
+            self.reader.get_readings_at([timestamp])
+            batch_key = self.reader._db.Get.call_args[0][1]
+        
+        self.assertEqual(batch_key, single_key)
+    
+    def test_get_readings_at(self):
+        """Test that lookups return one row per timestamp with NaN for misses."""
+        timestamps = [datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 12, 1)]
+        found_key = self.reader._timestamp_to_key(timestamps[0])
+        
+        def get(read_opts, key):
+            if key == found_key:
+                return b'value'
+            raise RuntimeError("NotFound: ")
+        
+        del self.reader._db.MultiGet
+        self.reader._db.Get.side_effect = get
+        parsed = {'co2_ppm': np.array([410.0]), 'temperature_c': np.array([np.nan]),
+                  'humidity_percent': np.array([45.0]), 'quality_flags': np.array([5])}
+        with patch.object(self.reader, '_parse_sensor_columns', return_value=parsed) as mock_parse:
+            result = self.reader.get_readings_at(timestamps)
+        
+        mock_parse.assert_called_once_with([(found_key, b'value')], [])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result['timestamp'].iloc[0], timestamps[0].astimezone(timezone.utc))
+        self.assertEqual(result['co2_ppm'].iloc[0], 410.0)
+        self.assertTrue(pd.isna(result['temperature_c'].iloc[0]))
+        self.assertTrue(pd.isna(result['co2_ppm'].iloc[1]))
+        self.assertEqual(result['quality_flags'].tolist(), [5, 0])
+    
+    def test_get_readings_at_multi_get(self):
+        """Test that lookups use one MultiGet call when the binding has it."""
+        timestamps = [datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 12, 1)]
+        keys = [self.reader._timestamp_to_key(ts) for ts in timestamps]
+        self.reader._db.MultiGet.return_value = [None, b'value']
+        parsed = {'co2_ppm': np.array([410.0]), 'temperature_c': np.array([21.5]),
+                  'humidity_percent': np.array([45.0]), 'quality_flags': np.array([0])}
+        with patch.object(self.reader, '_parse_sensor_columns', return_value=parsed) as mock_parse:
+            result = self.reader.get_readings_at(timestamps)
+        
+        self.reader._db.MultiGet.assert_called_once()
+        self.reader._db.Get.assert_not_called()
+        mock_parse.assert_called_once_with([(keys[1], b'value')], [])
+        self.assertTrue(pd.isna(result['co2_ppm'].iloc[0]))
+        self.assertEqual(result['co2_ppm'].iloc[1], 410.0)
+    
+    @patch('sensor_daemon.reader_simple._probe_daemon_running', return_value=True)
+    def test_is_daemon_running_cached(self, mock_probe):
+        """Test that repeated status checks within the TTL reuse one probe."""
+        self.assertTrue(self.reader.is_daemon_running())
+        self.assertTrue(self.reader.is_daemon_running())
+        
+        mock_probe.assert_called_once()
+    
+    @patch('sensor_daemon.reader_simple._probe_daemon_running', return_value=True)
+    def test_is_daemon_running_ttl_disabled(self, mock_probe):
+        """Test that a zero TTL probes on every call."""
+        self.reader.status_ttl = 0
+        
+        self.reader.is_daemon_running()
+        self.reader.is_daemon_running()
+        
+        self.assertEqual(mock_probe.call_count, 2)
+    
+    @patch('sensor_daemon.reader_simple.subprocess.run')
+    @patch('sensor_daemon.reader_simple._probe_daemon_running', return_value=False)
+    def test_is_daemon_running_without_subprocess(self, mock_probe, mock_run):
+        """Test that a conclusive /proc probe does not start systemctl."""
+        self.assertFalse(self.reader.is_daemon_running())
+        
+        mock_run.assert_not_called()
+    
+    @patch('sensor_daemon.reader_simple.subprocess.run')
+    @patch('sensor_daemon.reader_simple._probe_daemon_running', return_value=None)
+    def test_is_daemon_running_subprocess_fallback(self, mock_probe, mock_run):
+        """Test that systemctl is used when /proc cannot be inspected."""
+        mock_run.return_value = MagicMock(returncode=0, stdout='active\n')
+        
+        self.assertTrue(self.reader.is_daemon_running())
+        
+        mock_run.assert_called_once()
+        self.assertIs(mock_run.call_args.kwargs['close_fds'], False)
+    
+    @patch('sensor_daemon.reader_simple.shutil.which', return_value='/usr/bin/systemctl')
+    @patch('sensor_daemon.reader_simple.subprocess.run')
+    @patch('sensor_daemon.reader_simple._probe_daemon_running', return_value=None)
+    def test_subprocess_fallback_absolute_path(self, mock_probe, mock_run, mock_which):
+        """Test that the fallback starts systemctl by its resolved absolute path."""
+        reader_simple._command_path.cache_clear()
+        self.addCleanup(reader_simple._command_path.cache_clear)
+        mock_run.return_value = MagicMock(returncode=0, stdout='active\n')
+        
+        self.reader.is_daemon_running()
+        
+        self.assertEqual(mock_run.call_args[0][0][0], '/usr/bin/systemctl')
+        mock_which.assert_called_once_with('systemctl')
+
+
+if __name__ == '__main__':
+    unittest.main()
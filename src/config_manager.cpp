@@ -319,6 +319,10 @@ void ConfigManager::parse_monitoring_section(const toml::value& toml_data, Daemo
         if (monitoring_section.contains("http_server_bind_address")) {
             config.monitoring.http_server_bind_address = toml::find<std::string>(monitoring_section, "http_server_bind_address");
         }
+        
+        if (monitoring_section.contains("http_server_unix_socket")) {
+            config.monitoring.http_server_unix_socket = toml::find<std::string>(monitoring_section, "http_server_unix_socket");
+        }
     }
 }
 
@@ -435,7 +435,8 @@ bool DaemonCore::initialize_components() {
         
         // Initialize storage first (required for data persistence)
         storage_ = std::make_unique<TimeSeriesStorage>();
-        if (!storage_->initialize(config_.storage.data_directory, config_.daemon.data_retention)) {
+        if (!storage_->initialize(config_.storage.data_directory, config_.daemon.data_retention,
+                                  config_.storage.max_memory_cache_mb)) {
             LOG_ERROR("Failed to initialize storage engine", {
                 {"data_directory", config_.storage.data_directory},
                 {"retention_hours", std::to_string(config_.daemon.data_retention.count())}
@@ -610,7 +611,8 @@ bool DaemonCore::initialize_health_monitoring() {
         if (config_.monitoring.http_server_enabled) {
             health_server_ = std::make_unique<HealthMonitorServer>(health_monitor_.get(), storage_.get());
             if (!health_server_->start(config_.monitoring.http_server_port, 
-                                     config_.monitoring.http_server_bind_address)) {
+                                     config_.monitoring.http_server_bind_address,
+                                     config_.monitoring.http_server_unix_socket)) {
                 LOG_WARN("Failed to start health monitor HTTP server, continuing without it");
             } else {
                 LOG_INFO("Health monitor HTTP server started", {
@@ -206,6 +206,86 @@ DataAggregator::group_readings_by_interval(
     return grouped;
 }
 
+// StreamingAggregator implementation
+StreamingAggregator::StreamingAggregator(std::chrono::minutes interval_minutes)
+    : interval_minutes_(interval_minutes) {}
+
+void StreamingAggregator::add(const SensorData& reading) {
+    if (interval_minutes_.count() <= 0) {
+        return;
+    }
+    
+    if (!first_timestamp_.has_value() || reading.timestamp < first_timestamp_.value()) {
+        first_timestamp_ = reading.timestamp;
+    }
+    if (!last_timestamp_.has_value() || reading.timestamp > last_timestamp_.value()) {
+        last_timestamp_ = reading.timestamp;
+    }
+    
+    auto& stats = intervals_[DataAggregator::align_to_interval(reading.timestamp, interval_minutes_)];
+    stats.co2_ppm.add(reading.co2_ppm);
+    stats.temperature_c.add(reading.temperature_c);
+    stats.humidity_percent.add(reading.humidity_percent);
+}
+
+void StreamingAggregator::add(const std::vector<SensorData>& readings) {
+    for (const auto& reading : readings) {
+        add(reading);
+    }
+}
+
+std::vector<AggregateData> StreamingAggregator::finish() const {
+    if (!first_timestamp_.has_value() || interval_minutes_.count() <= 0) {
+        return {};
+    }
+    
+    // Same interval grid as DataAggregator::aggregate_by_interval
+    auto start_time = DataAggregator::align_to_interval(first_timestamp_.value(), interval_minutes_);
+    auto intervals = DataAggregator::generate_intervals(start_time, last_timestamp_.value(), interval_minutes_);
+    
+    std::vector<AggregateData> aggregates;
+    aggregates.reserve(intervals.size());
+    
+    for (const auto& interval_start : intervals) {
+        AggregateData aggregate(interval_start);
+        
+        auto it = intervals_.find(interval_start);
+        if (it != intervals_.end()) {
+            aggregate.co2_ppm = it->second.co2_ppm.to_value_stats();
+            aggregate.temperature_c = it->second.temperature_c.to_value_stats();
+            aggregate.humidity_percent = it->second.humidity_percent.to_value_stats();
+        }
+        
+        aggregates.push_back(aggregate);
+    }
+    
+    return aggregates;
+}
+
+void StreamingAggregator::RunningStats::add(const std::optional<float>& value) {
+    if (!value.has_value() || !std::isfinite(value.value())) {
+        return;
+    }
+    
+    double v = value.value();
+    if (count == 0) {
+        min = v;
+        max = v;
+    } else {
+        min = std::min(min, v);
+        max = std::max(max, v);
+    }
+    sum += v;
+    ++count;
+}
+
+AggregateData::ValueStats StreamingAggregator::RunningStats::to_value_stats() const {
+    if (count == 0) {
+        return AggregateData::ValueStats(); // has_data remains false
+    }
+    return AggregateData::ValueStats(sum / count, min, max, count);
+}
+
 // IntervalParser implementation
 std::optional<std::chrono::minutes> IntervalParser::parse(const std::string& interval_str) {
     if (!is_valid_format(interval_str)) {
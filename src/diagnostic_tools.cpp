@@ -22,10 +22,15 @@
 #include <condition_variable>
 #include <atomic>
 #include <sys/socket.h>
+#include <sys/un.h>
 #include <netinet/in.h>
 #include <arpa/inet.h>
 #include <sys/select.h>
 
+#ifdef HAVE_ZLIB
+#include <zlib.h>
+#endif
+
 namespace sensor_daemon {
 
 // Global variables for health endpoint update thread
@@ -1342,7 +1347,8 @@ HealthMonitorServer::~HealthMonitorServer() {
     stop();
 }
 
-bool HealthMonitorServer::start(int port, const std::string& bind_address) {
+bool HealthMonitorServer::start(int port, const std::string& bind_address,
+                                const std::string& unix_socket_path) {
     if (running_) {
         return true; // Already running
     }
@@ -1354,6 +1360,7 @@ bool HealthMonitorServer::start(int port, const std::string& bind_address) {
     
     port_ = port;
     bind_address_ = bind_address;
+    unix_socket_path_ = unix_socket_path;
     running_ = true;
     
     // Start server thread
@@ -1361,7 +1368,8 @@ bool HealthMonitorServer::start(int port, const std::string& bind_address) {
     
     LOG_INFO("Health monitor server started", {
         {"port", std::to_string(port_)},
-        {"bind_address", bind_address_}
+        {"bind_address", bind_address_},
+        {"unix_socket", unix_socket_path_.empty() ? "disabled" : unix_socket_path_}
     });
     
     return true;
@@ -1455,17 +1463,28 @@ void HealthMonitorServer::server_loop() {
         {"bind_address", bind_address_}
     });
     
+    // Optional UNIX domain socket for local clients; TCP keeps working if it fails
+    int unix_fd = -1;
+    if (!unix_socket_path_.empty()) {
+        unix_fd = create_unix_listener();
+    }
+    
     // Main server loop
     while (running_) {
         fd_set read_fds;
         FD_ZERO(&read_fds);
         FD_SET(server_fd, &read_fds);
+        int max_fd = server_fd;
+        if (unix_fd >= 0) {
+            FD_SET(unix_fd, &read_fds);
+            max_fd = std::max(max_fd, unix_fd);
+        }
         
         struct timeval timeout;
         timeout.tv_sec = 1;  // 1 second timeout for responsive shutdown
         timeout.tv_usec = 0;
         
-        int activity = select(server_fd + 1, &read_fds, NULL, NULL, &timeout);
+        int activity = select(max_fd + 1, &read_fds, NULL, NULL, &timeout);
         
         if (activity < 0 && errno != EINTR) {
             LOG_ERROR("Select error", {
@@ -1474,16 +1493,17 @@ void HealthMonitorServer::server_loop() {
             break;
         }
         
-        if (activity == 0 || !running_) {
-            // Timeout or shutdown requested
+        if (activity <= 0 || !running_) {
+            // Timeout, interrupted or shutdown requested
             continue;
         }
         
-        if (FD_ISSET(server_fd, &read_fds)) {
-            struct sockaddr_in client_addr;
-            socklen_t client_len = sizeof(client_addr);
+        for (int listen_fd : {server_fd, unix_fd}) {
+            if (listen_fd < 0 || !FD_ISSET(listen_fd, &read_fds)) {
+                continue;
+            }
             
-            int client_fd = accept(server_fd, (struct sockaddr*)&client_addr, &client_len);
+            int client_fd = accept(listen_fd, NULL, NULL);
             if (client_fd < 0) {
                 if (errno != EAGAIN && errno != EWOULDBLOCK) {
                     LOG_ERROR("Accept error", {
@@ -1493,62 +1513,184 @@ void HealthMonitorServer::server_loop() {
                 continue;
             }
             
-            // Handle client request
-            char buffer[1024] = {0};
-            read(client_fd, buffer, sizeof(buffer) - 1);
-            
-            // Extract client IP for security validation
-            std::string client_ip = extract_client_ip(client_fd);
-            
-            // Parse HTTP request
-            std::string request(buffer);
-            
-            // Start request timing for logging
-            auto request_start_time = std::chrono::steady_clock::now();
-            
-            // Extract method and path for logging
-            auto [method, path] = HttpParameterParser::extract_method_and_path(request);
-            
-            // Process request with security validation and enhanced routing
-            std::string response = process_request_with_security(request, client_ip);
-            
-            // Calculate response time
-            auto request_end_time = std::chrono::steady_clock::now();
-            auto response_time_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
-                request_end_time - request_start_time).count();
-            
-            // Log request details with response time
-            bool is_data_endpoint = path.find("/data/") == 0;
-            if (is_data_endpoint) {
-                // Enhanced logging for data endpoints
-                LOG_INFO("Data endpoint request processed", {
-                    {"method", method},
-                    {"path", path},
-                    {"client_ip", client_ip},
-                    {"response_time_ms", std::to_string(response_time_ms)},
-                    {"response_size_bytes", std::to_string(response.length())},
-                    {"status_code", response.substr(9, 3)} // Extract status code from "HTTP/1.1 XXX"
-                });
-            } else {
-                // Standard logging for health endpoints
-                LOG_DEBUG("Health endpoint request processed", {
-                    {"method", method},
-                    {"path", path},
-                    {"client_ip", client_ip},
-                    {"response_time_ms", std::to_string(response_time_ms)}
-                });
-            }
-            
-            // Send response
-            write(client_fd, response.c_str(), response.length());
-            close(client_fd);
+            handle_client_connection(client_fd);
         }
     }
     
     close(server_fd);
+    if (unix_fd >= 0) {
+        close(unix_fd);
+        unlink(unix_socket_path_.c_str());
+    }
     running_ = false;
 }
 
+int HealthMonitorServer::create_unix_listener() const {
+    struct sockaddr_un address;
+    if (unix_socket_path_.size() >= sizeof(address.sun_path)) {
+        LOG_ERROR("UNIX socket path too long", {
+            {"path", unix_socket_path_}
+        });
+        return -1;
+    }
+    
+    int unix_fd = socket(AF_UNIX, SOCK_STREAM, 0);
+    if (unix_fd < 0) {
+        LOG_ERROR("Failed to create UNIX socket", {
+            {"error", strerror(errno)}
+        });
+        return -1;
+    }
+    
+    std::memset(&address, 0, sizeof(address));
+    address.sun_family = AF_UNIX;
+    std::strncpy(address.sun_path, unix_socket_path_.c_str(), sizeof(address.sun_path) - 1);
+    
+    // Remove a stale socket left behind by a previous run
+    unlink(unix_socket_path_.c_str());
+    
+    if (bind(unix_fd, (struct sockaddr*)&address, sizeof(address)) < 0 ||
+        listen(unix_fd, 10) < 0) {
+        LOG_ERROR("Failed to listen on UNIX socket", {
+            {"error", strerror(errno)},
+            {"path", unix_socket_path_}
+        });
+        close(unix_fd);
+        return -1;
+    }
+    
+    // Owner and group only, matching the local-access intent of 127.0.0.1
+    chmod(unix_socket_path_.c_str(), 0660);
+    
+    int flags = fcntl(unix_fd, F_GETFL, 0);
+    fcntl(unix_fd, F_SETFL, flags | O_NONBLOCK);
+    
+    LOG_INFO("Health monitor server listening on UNIX socket", {
+        {"path", unix_socket_path_}
+    });
+    
+    return unix_fd;
+}
+
+namespace {
+    // Bodies smaller than this are sent uncompressed; gzip overhead outweighs the savings
+    constexpr size_t MIN_COMPRESS_BYTES = 1024;
+    
+    // Aggregate queries read in the same batches and stop at the same cap
+    // (get_readings_in_range's default) as the range query they replaced
+    constexpr size_t AGGREGATE_BATCH_SIZE = 1000;
+    constexpr size_t AGGREGATE_MAX_READINGS = 10000;
+    
+    /**
+     * Gzip-compress the body of a complete HTTP response
+     * @param response Response with headers and a Content-Length header
+     * @return true if the response was replaced by a compressed one
+     */
+    bool compress_response(std::string& response) {
+#ifdef HAVE_ZLIB
+        size_t header_end = response.find("\r\n\r\n");
+        if (header_end == std::string::npos) {
+            return false;
+        }
+        
+        size_t body_start = header_end + 4;
+        size_t body_size = response.size() - body_start;
+        size_t length_pos = response.find("Content-Length: ");
+        if (body_size < MIN_COMPRESS_BYTES || length_pos == std::string::npos || length_pos > header_end) {
+            return false;
+        }
+        
+        z_stream stream{};
+        // windowBits 15 + 16 selects the gzip container
+        if (deflateInit2(&stream, Z_DEFAULT_COMPRESSION, Z_DEFLATED, 15 + 16, 8, Z_DEFAULT_STRATEGY) != Z_OK) {
+            return false;
+        }
+        
+        std::string compressed(deflateBound(&stream, body_size), '\0');
+        stream.next_in = reinterpret_cast<Bytef*>(&response[body_start]);
+        stream.avail_in = static_cast<uInt>(body_size);
+        stream.next_out = reinterpret_cast<Bytef*>(&compressed[0]);
+        stream.avail_out = static_cast<uInt>(compressed.size());
+        
+        int result = deflate(&stream, Z_FINISH);
+        compressed.resize(stream.total_out);
+        deflateEnd(&stream);
+        if (result != Z_STREAM_END) {
+            return false;
+        }
+        
+        // Rewrite Content-Length and announce the encoding
+        size_t length_end = response.find("\r\n", length_pos);
+        std::string headers = response.substr(0, length_pos) +
+            "Content-Length: " + std::to_string(compressed.size()) + "\r\n" +
+            "Content-Encoding: gzip\r\n" +
+            response.substr(length_end + 2, header_end - length_end - 2);
+        response = headers + "\r\n\r\n" + compressed;
+        return true;
+#else
+        (void)response;
+        return false;
+#endif
+    }
+}
+
+void HealthMonitorServer::handle_client_connection(int client_fd) {
+    // Handle client request
+    char buffer[1024] = {0};
+    read(client_fd, buffer, sizeof(buffer) - 1);
+    
+    // Extract client IP for security validation
+    std::string client_ip = extract_client_ip(client_fd);
+    
+    // Parse HTTP request
+    std::string request(buffer);
+    
+    // Start request timing for logging
+    auto request_start_time = std::chrono::steady_clock::now();
+    
+    // Extract method and path for logging
+    auto [method, path] = HttpParameterParser::extract_method_and_path(request);
+    
+    // Process request with security validation and enhanced routing
+    std::string response = process_request_with_security(request, client_ip);
+    
+    // Sensor data bodies are repetitive JSON and compress well
+    bool is_data_endpoint = path.find("/data/") == 0;
+    if (is_data_endpoint && HttpParameterParser::accepts_encoding(request, "gzip")) {
+        compress_response(response);
+    }
+    
+    // Calculate response time
+    auto request_end_time = std::chrono::steady_clock::now();
+    auto response_time_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
+        request_end_time - request_start_time).count();
+    
+    // Log request details with response time
+    if (is_data_endpoint) {
+        // Enhanced logging for data endpoints
+        LOG_INFO("Data endpoint request processed", {
+            {"method", method},
+            {"path", path},
+            {"client_ip", client_ip},
+            {"response_time_ms", std::to_string(response_time_ms)},
+            {"response_size_bytes", std::to_string(response.length())},
+            {"status_code", response.substr(9, 3)} // Extract status code from "HTTP/1.1 XXX"
+        });
+    } else {
+        // Standard logging for health endpoints
+        LOG_DEBUG("Health endpoint request processed", {
+            {"method", method},
+            {"path", path},
+            {"client_ip", client_ip},
+            {"response_time_ms", std::to_string(response_time_ms)}
+        });
+    }
+    
+    // Send response
+    write(client_fd, response.c_str(), response.length());
+    close(client_fd);
+}
+
 std::string HealthMonitorServer::handle_health_request() const {
     std::string response = "HTTP/1.1 200 OK\r\n";
     response += "Content-Type: application/json\r\n";
@@ -1715,7 +1857,10 @@ std::string HealthMonitorServer::handle_recent_data_request(const std::string& r
             });
         }
         
-        // Generate JSON response
+        // Generate JSON response, column-oriented when the client asks for it
+        if (HttpParameterParser::accepts_media_type(request, JsonResponseBuilder::COLUMNS_CONTENT_TYPE)) {
+            return JsonResponseBuilder::create_columns_response(readings);
+        }
         return JsonResponseBuilder::create_readings_response(readings);
         
     } catch (const std::exception& e) {
@@ -1832,7 +1977,10 @@ std::string HealthMonitorServer::handle_range_data_request(const std::string& re
             });
         }
         
-        // Generate JSON response
+        // Generate JSON response, column-oriented when the client asks for it
+        if (HttpParameterParser::accepts_media_type(request, JsonResponseBuilder::COLUMNS_CONTENT_TYPE)) {
+            return JsonResponseBuilder::create_columns_response(readings);
+        }
         return JsonResponseBuilder::create_range_response(
             readings, 
             params.start_time.value(), 
@@ -1966,17 +2114,24 @@ std::string HealthMonitorServer::handle_aggregates_request(const std::string& re
             interval = params.interval.value();
         }
         
-        // Query raw readings from storage
-        std::vector<SensorData> readings = storage_->get_readings_in_range(
-            start_tp.value(), 
-            end_tp.value()
+        // Aggregate readings batch by batch as they are read from storage,
+        // so the raw range is never held in memory at once. Dashboards repeat
+        // these queries, so unlike exports they warm the block cache, and
+        // they keep the range query's result cap.
+        StreamingAggregator aggregator(DataAggregator::parse_interval(interval).value_or(std::chrono::minutes(0)));
+        storage_->stream_readings_in_range(
+            start_tp.value(),
+            end_tp.value(),
+            [&aggregator](const std::vector<SensorData>& batch) -> bool {
+                aggregator.add(batch);
+                return true; // Continue streaming
+            },
+            AGGREGATE_BATCH_SIZE,
+            AGGREGATE_MAX_READINGS,
+            /*fill_cache=*/true
         );
         
-        // Aggregate the readings
-        std::vector<AggregateData> aggregates = DataAggregator::aggregate_by_interval(
-            readings, 
-            interval
-        );
+        std::vector<AggregateData> aggregates = aggregator.finish();
         
         // Generate JSON response
         return JsonResponseBuilder::create_aggregates_response(
@@ -2153,12 +2308,18 @@ std::string HealthMonitorServer::route_request(const std::string& request, const
 }
 
 std::string HealthMonitorServer::extract_client_ip(int client_fd) const {
-    struct sockaddr_in client_addr;
+    struct sockaddr_storage client_addr;
     socklen_t client_len = sizeof(client_addr);
     
     if (getpeername(client_fd, (struct sockaddr*)&client_addr, &client_len) == 0) {
+        if (client_addr.ss_family == AF_UNIX) {
+            // Local clients on the UNIX socket share one rate limit bucket
+            return "unix";
+        }
+        
         char ip_str[INET_ADDRSTRLEN];
-        if (inet_ntop(AF_INET, &client_addr.sin_addr, ip_str, INET_ADDRSTRLEN)) {
+        auto* inet_addr = reinterpret_cast<struct sockaddr_in*>(&client_addr);
+        if (inet_ntop(AF_INET, &inet_addr->sin_addr, ip_str, INET_ADDRSTRLEN)) {
             return std::string(ip_str);
         }
     }
@@ -4,6 +4,8 @@
 #include <iomanip>
 #include <ctime>
 #include <algorithm>
+#include <cctype>
+#include <cstdlib>
 
 namespace sensor_daemon {
 
@@ -188,6 +190,80 @@ std::pair<std::string, std::string> HttpParameterParser::extract_method_and_path
     return {"", ""};
 }
 
+bool HttpParameterParser::accepts_media_type(const std::string& request, const std::string& media_type) {
+    auto accept = find_header_value(request, "accept");
+    return accept.has_value() && accept->find(media_type) != std::string::npos;
+}
+
+bool HttpParameterParser::accepts_encoding(const std::string& request, const std::string& encoding) {
+    auto accept_encoding = find_header_value(request, "accept-encoding");
+    if (!accept_encoding.has_value()) {
+        return false;
+    }
+    
+    auto lower = [](std::string value) {
+        std::transform(value.begin(), value.end(), value.begin(),
+                      [](unsigned char c) { return std::tolower(c); });
+        return value;
+    };
+    auto trim = [](const std::string& value) {
+        size_t first = value.find_first_not_of(" \t\r");
+        if (first == std::string::npos) {
+            return std::string();
+        }
+        size_t last = value.find_last_not_of(" \t\r");
+        return value.substr(first, last - first + 1);
+    };
+    
+    // Codings are comma-separated tokens, each with optional ";q=" weight;
+    // a weight of 0 means the coding is refused
+    const std::string wanted = lower(encoding);
+    std::istringstream codings(accept_encoding.value());
+    std::string element;
+    while (std::getline(codings, element, ',')) {
+        std::istringstream parts(element);
+        std::string coding;
+        std::getline(parts, coding, ';');
+        if (lower(trim(coding)) != wanted) {
+            continue;
+        }
+        
+        std::string param;
+        while (std::getline(parts, param, ';')) {
+            param = lower(trim(param));
+            if (param.compare(0, 2, "q=") == 0) {
+                return std::strtod(param.c_str() + 2, nullptr) > 0.0;
+            }
+        }
+        return true;
+    }
+    
+    return false;
+}
+
+std::optional<std::string> HttpParameterParser::find_header_value(const std::string& request, const std::string& name) {
+    // Header names are case-insensitive; values are returned as sent
+    std::istringstream stream(request);
+    std::string line;
+    
+    std::getline(stream, line); // Skip the request line
+    while (std::getline(stream, line) && line != "\r" && !line.empty()) {
+        size_t colon = line.find(':');
+        if (colon == std::string::npos) {
+            continue;
+        }
+        
+        std::string header_name = line.substr(0, colon);
+        std::transform(header_name.begin(), header_name.end(), header_name.begin(),
+                      [](unsigned char c) { return std::tolower(c); });
+        if (header_name == name) {
+            return line.substr(colon + 1);
+        }
+    }
+    
+    return std::nullopt;
+}
+
 int HttpParameterParser::hex_to_int(char hex) {
     if (hex >= '0' && hex <= '9') {
         return hex - '0';
@@ -48,6 +48,50 @@ std::string JsonResponseBuilder::create_range_response(const std::vector<SensorD
     return create_http_header(HttpStatus::OK, json_body.length()) + json_body;
 }
 
+std::string JsonResponseBuilder::create_columns_response(const std::vector<SensorData>& readings) {
+    std::ostringstream json;
+    
+    // Write one field of every reading as a JSON array
+    auto write_column = [&](const char* name, auto&& write_value) {
+        json << "    \"" << name << "\": [";
+        for (size_t i = 0; i < readings.size(); ++i) {
+            if (i > 0) json << ",";
+            write_value(readings[i]);
+        }
+        json << "]";
+    };
+    auto write_optional = [&](const std::optional<float>& value) {
+        if (value.has_value()) {
+            json << format_json_number(value.value(), 1);
+        } else {
+            json << "null";
+        }
+    };
+    
+    json << "{\n";
+    json << "  \"columns\": {\n";
+    
+    write_column("timestamp_us", [&](const SensorData& reading) {
+        json << std::chrono::duration_cast<std::chrono::microseconds>(
+            reading.timestamp.time_since_epoch()).count();
+    });
+    json << ",\n";
+    write_column("co2_ppm", [&](const SensorData& reading) { write_optional(reading.co2_ppm); });
+    json << ",\n";
+    write_column("temperature_c", [&](const SensorData& reading) { write_optional(reading.temperature_c); });
+    json << ",\n";
+    write_column("humidity_percent", [&](const SensorData& reading) { write_optional(reading.humidity_percent); });
+    json << ",\n";
+    write_column("quality_flags", [&](const SensorData& reading) { json << reading.quality_flags; });
+    
+    json << "\n  },\n";
+    json << "  \"total_count\": " << readings.size() << "\n";
+    json << "}\n";
+    
+    std::string json_body = json.str();
+    return create_http_header(HttpStatus::OK, json_body.length(), COLUMNS_CONTENT_TYPE) + json_body;
+}
+
 std::string JsonResponseBuilder::create_aggregates_response(const std::vector<AggregateData>& aggregates,
                                                           const std::string& start_time,
                                                           const std::string& end_time,
@@ -201,11 +245,12 @@ std::string JsonResponseBuilder::get_current_timestamp() {
     return timestamp_to_iso8601(std::chrono::system_clock::now());
 }
 
-std::string JsonResponseBuilder::create_http_header(int status_code, size_t content_length) {
+std::string JsonResponseBuilder::create_http_header(int status_code, size_t content_length,
+                                                  const std::string& content_type) {
     std::ostringstream header;
     
     header << "HTTP/1.1 " << status_code << " " << get_status_text(status_code) << "\r\n";
-    header << "Content-Type: application/json\r\n";
+    header << "Content-Type: " << content_type << "\r\n";
     header << "Connection: close\r\n";
     header << "Access-Control-Allow-Origin: *\r\n";  // Enable CORS for web clients
     header << "Cache-Control: no-cache\r\n";
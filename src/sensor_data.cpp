@@ -1,5 +1,6 @@
 #include "sensor_data.hpp"
 #include <chrono>
+#include <limits>
 
 namespace sensor_daemon {
 
@@ -68,9 +69,14 @@ std::string SensorDataConverter::serialize(const SensorData& reading) {
 }
 
 std::optional<SensorData> SensorDataConverter::deserialize(const std::string& data) {
+    return deserialize(data.data(), data.size());
+}
+
+std::optional<SensorData> SensorDataConverter::deserialize(const char* data, size_t size) {
     sensor_daemon::SensorReading proto_reading;
     
-    if (!proto_reading.ParseFromString(data)) {
+    if (size > static_cast<size_t>(std::numeric_limits<int>::max()) ||
+        !proto_reading.ParseFromArray(data, static_cast<int>(size))) {
         return std::nullopt; // Return nullopt on deserialization failure
     }
     
@@ -2,6 +2,7 @@
 #include <iostream>
 #include <filesystem>
 #include <cstring>
+#include <algorithm>
 #include <arpa/inet.h>
 #include <sys/statvfs.h>
 #include <rocksdb/filter_policy.h>
@@ -19,9 +20,11 @@ TimeSeriesStorage::~TimeSeriesStorage() {
 }
 
 bool TimeSeriesStorage::initialize(const std::string& data_directory, 
-                                 std::chrono::hours retention_hours) {
+                                 std::chrono::hours retention_hours,
+                                 size_t block_cache_mb) {
     data_directory_ = data_directory;
     retention_hours_ = retention_hours;
+    block_cache_mb_ = block_cache_mb;
     
     try {
         // Create data directory if it doesn't exist
@@ -181,14 +184,18 @@ rocksdb::Options TimeSeriesStorage::get_db_options() const {
     options.level0_slowdown_writes_trigger = 8;
     options.level0_stop_writes_trigger = 12;
     
+    // Keep every SST file open so range seeks never reopen table files
+    // (small file count: 8MB files of compact time-series records)
+    options.max_open_files = -1;
+    
     // Table options for better performance
     rocksdb::BlockBasedTableOptions table_options;
     table_options.block_size = 4 * 1024;  // 4KB blocks
     table_options.cache_index_and_filter_blocks = true;
     table_options.pin_l0_filter_and_index_blocks_in_cache = true;
     
-    // Small block cache to stay within memory limits
-    table_options.block_cache = rocksdb::NewLRUCache(2 * 1024 * 1024);  // 2MB cache
+    // Block cache sized by storage.max_memory_cache_mb to stay within memory limits
+    table_options.block_cache = rocksdb::NewLRUCache(block_cache_mb_ * 1024 * 1024);
     
     // Bloom filter for faster lookups
     table_options.filter_policy.reset(rocksdb::NewBloomFilterPolicy(10, false));
@@ -329,8 +336,9 @@ std::vector<SensorData> TimeSeriesStorage::get_recent_readings_no_cache(int coun
         iterator->SeekToLast();
         
         while (iterator->Valid() && static_cast<int>(readings.size()) < count) {
-            // Deserialize the value
-            auto sensor_data = SensorDataConverter::deserialize(iterator->value().ToString());
+            // Deserialize the value in place, without copying the slice
+            const rocksdb::Slice value = iterator->value();
+            auto sensor_data = SensorDataConverter::deserialize(value.data(), value.size());
             if (sensor_data.has_value()) {
                 readings.push_back(std::move(sensor_data.value()));
             }
@@ -376,29 +384,35 @@ std::vector<SensorData> TimeSeriesStorage::get_readings_in_range(
     std::vector<SensorData> readings;
     
     try {
-        // Use optimized iterator with prefetching
-        auto iterator = create_optimized_iterator(std::min(max_results, 1000));
+        // Create start and end keys; the iterator bound is exclusive, so stop
+        // one microsecond past the inclusive end
+        std::string start_key = timestamp_to_key(start);
+        std::string end_key = timestamp_to_key(end + std::chrono::microseconds(1));
+        rocksdb::Slice lower_bound(start_key);
+        rocksdb::Slice upper_bound(end_key);
+        
+        // Use optimized iterator with prefetching, bounded to the range
+        auto iterator = create_optimized_iterator(std::min(max_results, 1000),
+                                                  &lower_bound, &upper_bound);
         if (!iterator) {
             timer.mark_failed();
             return readings;
         }
         
-        // Reserve memory to avoid reallocations
-        readings.reserve(std::min(max_results, 1000));
-        
-        // Create start and end keys
-        std::string start_key = timestamp_to_key(start);
-        std::string end_key = timestamp_to_key(end);
+        // Reserve memory for the expected result size to avoid reallocations
+        uint64_t estimated_records = estimate_records_in_range(start_key, end_key);
+        readings.reserve(static_cast<size_t>(std::min<uint64_t>(
+            std::max<uint64_t>(estimated_records, 1000), static_cast<uint64_t>(max_results))));
         
         // Seek to start position
         iterator->Seek(start_key);
         
         while (iterator->Valid() && 
-               iterator->key().ToString() <= end_key && 
                static_cast<int>(readings.size()) < max_results) {
             
-            // Deserialize the value
-            auto sensor_data = SensorDataConverter::deserialize(iterator->value().ToString());
+            // Deserialize the value in place, without copying the slice
+            const rocksdb::Slice value = iterator->value();
+            auto sensor_data = SensorDataConverter::deserialize(value.data(), value.size());
             if (sensor_data.has_value()) {
                 readings.emplace_back(std::move(sensor_data.value()));
             }
@@ -437,7 +451,8 @@ size_t TimeSeriesStorage::stream_readings_in_range(
     std::chrono::system_clock::time_point end,
     std::function<bool(const std::vector<SensorData>&)> callback,
     size_t batch_size,
-    size_t max_results) const {
+    size_t max_results,
+    bool fill_cache) const {
     
     if (!db_ || start > end || !callback) {
         return 0;
@@ -456,17 +471,22 @@ size_t TimeSeriesStorage::stream_readings_in_range(
     max_results = std::min(max_results, size_t(100000)); // Limit total results
     
     try {
-        // Use optimized iterator with prefetching
-        auto iterator = create_optimized_iterator(batch_size);
+        // Create start and end keys; the iterator bound is exclusive, so stop
+        // one microsecond past the inclusive end
+        std::string start_key = timestamp_to_key(start);
+        std::string end_key = timestamp_to_key(end + std::chrono::microseconds(1));
+        rocksdb::Slice lower_bound(start_key);
+        rocksdb::Slice upper_bound(end_key);
+        
+        // Use optimized iterator with prefetching, bounded to the range. Bulk
+        // exports keep their blocks out of the block cache unless asked.
+        auto iterator = create_optimized_iterator(batch_size, &lower_bound, &upper_bound,
+                                                  fill_cache);
         if (!iterator) {
             timer.mark_failed();
             return 0;
         }
         
-        // Create start and end keys
-        std::string start_key = timestamp_to_key(start);
-        std::string end_key = timestamp_to_key(end);
-        
         // Seek to start position
         iterator->Seek(start_key);
         
@@ -474,11 +494,11 @@ size_t TimeSeriesStorage::stream_readings_in_range(
         batch.reserve(batch_size);
         
         while (iterator->Valid() && 
-               iterator->key().ToString() <= end_key && 
                total_processed < max_results) {
             
-            // Deserialize the value
-            auto sensor_data = SensorDataConverter::deserialize(iterator->value().ToString());
+            // Deserialize the value in place, without copying the slice
+            const rocksdb::Slice value = iterator->value();
+            auto sensor_data = SensorDataConverter::deserialize(value.data(), value.size());
             if (sensor_data.has_value()) {
                 batch.emplace_back(std::move(sensor_data.value()));
             }
@@ -542,10 +562,10 @@ TimeSeriesStorage::DatabaseInfo TimeSeriesStorage::get_database_info() const {
     }
     
     try {
-        // Get approximate record count
-        std::string count_str;
-        if (db_->GetProperty("rocksdb.estimate-num-keys", &count_str)) {
-            info.total_records = std::stoull(count_str);
+        // Get approximate record count straight from the table metadata
+        uint64_t estimated_keys = 0;
+        if (db_->GetIntProperty(rocksdb::DB::Properties::kEstimateNumKeys, &estimated_keys)) {
+            info.total_records = estimated_keys;
         } else {
             info.total_records = 0;
         }
@@ -689,7 +709,32 @@ void TimeSeriesStorage::maintain_cache() const {
     }
 }
 
-std::unique_ptr<rocksdb::Iterator> TimeSeriesStorage::create_optimized_iterator(size_t prefetch_size) const {
+uint64_t TimeSeriesStorage::estimate_records_in_range(const std::string& start_key,
+                                                     const std::string& end_key) const {
+    if (!db_) {
+        return 0;
+    }
+    
+    rocksdb::Range range(start_key, end_key);
+    rocksdb::SizeApproximationOptions size_options;
+    size_options.include_memtables = true;  // Recent readings are usually still in memory
+    size_options.include_files = true;
+    
+    uint64_t size_bytes = 0;
+    rocksdb::Status status = db_->GetApproximateSizes(
+        size_options, db_->DefaultColumnFamily(), &range, 1, &size_bytes);
+    if (!status.ok()) {
+        return 0;
+    }
+    
+    return size_bytes / ESTIMATED_BYTES_PER_RECORD;
+}
+
+std::unique_ptr<rocksdb::Iterator> TimeSeriesStorage::create_optimized_iterator(
+    size_t prefetch_size,
+    const rocksdb::Slice* lower_bound,
+    const rocksdb::Slice* upper_bound,
+    bool fill_cache) const {
     if (!db_) {
         return nullptr;
     }
@@ -705,8 +750,12 @@ std::unique_ptr<rocksdb::Iterator> TimeSeriesStorage::create_optimized_iterator(
         read_options.readahead_size = std::min(estimated_bytes, size_t(1024 * 1024)); // Max 1MB
     }
     
+    // Let RocksDB stop at the range boundaries instead of comparing keys per row
+    read_options.iterate_lower_bound = lower_bound;
+    read_options.iterate_upper_bound = upper_bound;
+    
     // Use fill cache for frequently accessed data
-    read_options.fill_cache = true;
+    read_options.fill_cache = fill_cache;
     
     return std::unique_ptr<rocksdb::Iterator>(db_->NewIterator(read_options));
 }
@@ -1,5 +1,6 @@
 #include <gtest/gtest.h>
 #include "data_aggregator.hpp"
+#include <algorithm>
 #include <chrono>
 #include <vector>
 
@@ -281,6 +282,32 @@ TEST_F(DataAggregatorTest, AggregateDifferentIntervalSizes) {
     }
 }
 
+TEST_F(DataAggregatorTest, StreamingAggregatorMatchesBatch) {
+    auto expected = DataAggregator::aggregate_by_interval(test_readings_, std::chrono::minutes(60));
+    
+    // Feed the same readings in uneven batches
+    StreamingAggregator aggregator(std::chrono::minutes(60));
+    for (size_t i = 0; i < test_readings_.size(); i += 7) {
+        size_t end = std::min(i + 7, test_readings_.size());
+        aggregator.add(std::vector<SensorData>(test_readings_.begin() + i, test_readings_.begin() + end));
+    }
+    auto aggregates = aggregator.finish();
+    
+    ASSERT_EQ(aggregates.size(), expected.size());
+    for (size_t i = 0; i < aggregates.size(); ++i) {
+        EXPECT_EQ(aggregates[i].timestamp, expected[i].timestamp);
+        EXPECT_EQ(aggregates[i].co2_ppm.count, expected[i].co2_ppm.count);
+        EXPECT_DOUBLE_EQ(aggregates[i].co2_ppm.mean, expected[i].co2_ppm.mean);
+        EXPECT_DOUBLE_EQ(aggregates[i].temperature_c.min, expected[i].temperature_c.min);
+        EXPECT_DOUBLE_EQ(aggregates[i].humidity_percent.max, expected[i].humidity_percent.max);
+    }
+}
+
+TEST_F(DataAggregatorTest, StreamingAggregatorEmpty) {
+    StreamingAggregator aggregator(std::chrono::minutes(60));
+    EXPECT_TRUE(aggregator.finish().empty());
+}
+
 TEST_F(DataAggregatorTest, GetSupportedFormats) {
     auto formats = IntervalParser::get_supported_formats();
     
@@ -335,6 +335,39 @@ TEST_F(HttpUtilsTest, ValidateIntervalInvalid) {
     EXPECT_FALSE(ParameterValidator::validate_interval(""));
 }
 
+TEST_F(HttpUtilsTest, AcceptsMediaType) {
+    std::string request = "GET /data/recent HTTP/1.1\r\n"
+                          "Host: localhost\r\n"
+                          "accept: application/vnd.sensor-daemon.columns+json, application/json;q=0.9\r\n"
+                          "\r\n";
+    
+    EXPECT_TRUE(HttpParameterParser::accepts_media_type(request, "application/vnd.sensor-daemon.columns+json"));
+    EXPECT_FALSE(HttpParameterParser::accepts_media_type(request, "application/x-protobuf"));
+    EXPECT_FALSE(HttpParameterParser::accepts_media_type("GET /data/recent HTTP/1.1\r\n\r\n", "application/json"));
+}
+
+TEST_F(HttpUtilsTest, AcceptsEncoding) {
+    std::string request = "GET /data/range HTTP/1.1\r\n"
+                          "Accept-Encoding: gzip, deflate\r\n"
+                          "\r\n";
+    
+    EXPECT_TRUE(HttpParameterParser::accepts_encoding(request, "gzip"));
+    EXPECT_FALSE(HttpParameterParser::accepts_encoding(request, "zstd"));
+    EXPECT_FALSE(HttpParameterParser::accepts_media_type(request, "gzip"));
+}
+
+TEST_F(HttpUtilsTest, AcceptsEncodingTokensAndWeights) {
+    auto request_with = [](const std::string& value) {
+        return "GET /data/range HTTP/1.1\r\nAccept-Encoding: " + value + "\r\n\r\n";
+    };
+    
+    EXPECT_TRUE(HttpParameterParser::accepts_encoding(request_with("GZIP;q=0.5"), "gzip"));
+    EXPECT_TRUE(HttpParameterParser::accepts_encoding(request_with("deflate, gzip ; q=1"), "gzip"));
+    EXPECT_FALSE(HttpParameterParser::accepts_encoding(request_with("gzip;q=0"), "gzip"));
+    EXPECT_FALSE(HttpParameterParser::accepts_encoding(request_with("gzip; q=0.000"), "gzip"));
+    EXPECT_FALSE(HttpParameterParser::accepts_encoding(request_with("x-gzip-foo"), "gzip"));
+}
+
 TEST_F(HttpUtilsTest, ParseIntervalValid) {
     auto result1 = ParameterValidator::parse_interval("1H");
     EXPECT_TRUE(result1.has_value());
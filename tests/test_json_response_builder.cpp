@@ -123,6 +123,23 @@ TEST_F(JsonResponseBuilderTest, CreateReadingsResponseEmpty) {
     EXPECT_TRUE(response.find("\"total_count\": 0") != std::string::npos);
 }
 
+// Test column-oriented readings response
+TEST_F(JsonResponseBuilderTest, CreateColumnsResponse) {
+    std::vector<SensorData> readings = {test_reading1_, test_reading_partial_};
+    std::string response = JsonResponseBuilder::create_columns_response(readings);
+    
+    auto timestamp_us = std::chrono::duration_cast<std::chrono::microseconds>(
+        test_reading1_.timestamp.time_since_epoch()).count();
+    
+    EXPECT_TRUE(response.find("HTTP/1.1 200 OK") != std::string::npos);
+    EXPECT_TRUE(response.find(std::string("Content-Type: ") + JsonResponseBuilder::COLUMNS_CONTENT_TYPE) != std::string::npos);
+    EXPECT_TRUE(response.find("\"timestamp_us\": [" + std::to_string(timestamp_us) + ",") != std::string::npos);
+    EXPECT_TRUE(response.find("\"co2_ppm\": [410.5,420") != std::string::npos);
+    EXPECT_TRUE(response.find("\"temperature_c\": [22.1,null]") != std::string::npos);
+    EXPECT_TRUE(response.find("\"quality_flags\": [7,1]") != std::string::npos);
+    EXPECT_TRUE(response.find("\"total_count\": 2") != std::string::npos);
+}
+
 // Test range response
 TEST_F(JsonResponseBuilderTest, CreateRangeResponse) {
     std::vector<SensorData> readings = {test_reading1_};
@@ -147,6 +147,22 @@ TEST_F(SensorDataTest, SerializeDeserializeComplete) {
     EXPECT_EQ(reading.quality_flags, complete_reading.quality_flags);
 }
 
+// Test deserialization straight from a raw buffer
+TEST_F(SensorDataTest, DeserializeFromBuffer) {
+    std::string serialized = SensorDataConverter::serialize(complete_reading);
+    
+    auto deserialized = SensorDataConverter::deserialize(serialized.data(), serialized.size());
+    ASSERT_TRUE(deserialized.has_value());
+    
+    // Serialization keeps microseconds; system_clock may be finer
+    EXPECT_EQ(std::chrono::duration_cast<std::chrono::microseconds>(
+                  deserialized->timestamp.time_since_epoch()),
+              std::chrono::duration_cast<std::chrono::microseconds>(
+                  complete_reading.timestamp.time_since_epoch()));
+    EXPECT_FLOAT_EQ(deserialized->co2_ppm.value(), 450.5f);
+    EXPECT_EQ(deserialized->quality_flags, complete_reading.quality_flags);
+}
+
 // Test serialization and deserialization with partial data
 TEST_F(SensorDataTest, SerializeDeserializePartial) {
     // Serialize